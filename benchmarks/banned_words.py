@@ -0,0 +1,111 @@
+"""Measure the time taken to check Voice Channel names against a large list of banned words in VoiceAdmin,
+comparing a substring search for each banned word with a single pass of a WordMatcher.
+
+The banned words and names are randomly generated, with some of the names containing a banned word.
+
+Usage:
+    python benchmarks/banned_words.py [--words 1000 10000 50000] [--names 1000]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("DB_OVERRIDE", "sqlite://")
+
+import extensions.VoiceAdmin as VoiceAdmin  # noqa: E402
+
+
+def make_words(count: int, rng: random.Random) -> list[str]:
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        for _ in range(count)
+    ]
+
+
+def make_names(count: int, words: list[str], rng: random.Random) -> list[str]:
+    names = []
+    for idx in range(count):
+        name = "".join(
+            rng.choices(string.ascii_letters + "4@3!_ ", k=rng.randint(8, 30))
+        )
+        if idx % 4 == 0:
+            name = f"{rng.choice(words)}{name}"
+        elif idx % 4 == 1:
+            name = f"{name}{rng.choice(words)}"
+        names.append(name)
+    return names
+
+
+def leet_substitution_per_character(input_string: str) -> str:
+    leet_characters = {
+        "a": ["4", "@"],
+        "b": ["8", "ß", "l3"],
+        "e": ["3"],
+        "g": ["6"],
+        "i": ["1", "!"],
+        "r": ["2"],
+        "s": ["5"],
+        "t": ["7", "+"],
+        "": ["_", "-", "'", "|", "~", '"'],
+    }
+
+    output_string = input_string.lower()
+    for replace_with, to_replace in leet_characters.items():
+        for character in to_replace:
+            output_string = output_string.replace(character, replace_with)
+    return output_string
+
+
+def check_per_word(name: str, words: list[str]) -> bool:
+    leet_sub_name = leet_substitution_per_character(name).strip()
+    for word in words:
+        position = leet_sub_name.find(word)
+        while position != -1:
+            if not VoiceAdmin.check_word_position(leet_sub_name, word, position):
+                return False
+            position = leet_sub_name.find(word, position + 1)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--names", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'words':>8}{'build':>12}{'per word':>14}{'matcher':>14}{'speedup':>10}")
+    for count in args.words:
+        words = make_words(count, rng)
+        names = make_names(args.names, words, rng)
+
+        start = time.perf_counter()
+        VoiceAdmin.BANNED_WORDS.build(words)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = [check_per_word(x, words) for x in names]
+        per_word = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [VoiceAdmin.check_vc_name_allowed(x) for x in names]
+        matcher = time.perf_counter() - start
+
+        if results != expected:
+            raise AssertionError("The matcher and per word results do not match")
+
+        print(
+            f"{count:>8}{build * 1000:>10.1f}ms"
+            f"{per_word / len(names) * 1e6:>12.1f}us"
+            f"{matcher / len(names) * 1e6:>12.1f}us"
+            f"{per_word / matcher:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Load test VCMusic by playing a local audio file in an increasing number of simulated guilds.
+
+The audio file is served over HTTP on localhost and queued in each guild in place of a YouTube stream, so that
+playback goes through the same play_next_song, MusicAudioSource and ffmpeg path as it does in production. Each
+guild has a fake voice client that reads frames at the same 20ms rate as a discord.py AudioPlayer, encoding them
+to Opus when they are not already Opus, and moves onto the next song in the queue when a song ends.
+
+For each guild count, reports the CPU used per stream by the bot and by ffmpeg, how late frames were read
+compared to their 20ms schedule (jitter), and how late the event loop woke from a sleep (loop lag).
+
+Usage:
+    python benchmarks/music_load.py <audio-file> [--guilds 1 10 25 50] [--seconds 20]
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import threading
+import time
+from statistics import quantiles
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("DB_OVERRIDE", "sqlite://")
+os.environ.setdefault("GOOGLE_API", "benchmark")
+
+from aiohttp import web  # noqa: E402
+from discord import Object  # noqa: E402
+from discord.opus import Encoder  # noqa: E402
+
+import extensions.VCMusic as VCMusic  # noqa: E402
+
+BENCHMARK_PORT = 8765
+
+
+class FakeVoiceClient:
+    """Plays sources in the same way as a discord.py VoiceClient, without sending any audio."""
+
+    def __init__(self, lateness: list[float]):
+        self.lateness = lateness
+        self.source = None
+        self.thread = None
+        self.stopped = threading.Event()
+        self.paused = False
+        self.channel = Object(id=0)
+
+    def play(self, source, after=None):
+        self.source = source
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self.run, args=(source, self.stopped, after), daemon=True
+        )
+        self.thread.start()
+
+    def run(self, source, stopped: threading.Event, after):
+        encoder = None if source.is_opus() else Encoder()
+        next_frame = time.perf_counter()
+        while not stopped.is_set():
+            data = source.read()
+            if not data:
+                break
+            if encoder:
+                encoder.encode(data, Encoder.SAMPLES_PER_FRAME)
+            self.lateness.append(max(0, time.perf_counter() - next_frame))
+            next_frame += VCMusic.MusicAudioSource.FRAME_LENGTH
+            time.sleep(max(0, next_frame - time.perf_counter()))
+        source.cleanup()
+        stopped.set()
+        if after:
+            after(None)
+
+    def stop(self):
+        self.stopped.set()
+
+    def is_playing(self) -> bool:
+        return self.thread is not None and not self.stopped.is_set()
+
+    def is_paused(self) -> bool:
+        return False
+
+    async def disconnect(self):
+        self.stop()
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+
+    def get_member(self, member_id: int):
+        return None
+
+
+class FakeBot:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.user = Object(id=1)
+
+
+def make_songs(url: str, duration: float, count: int) -> list[VCMusic.SongRequest]:
+    member = Object(id=VCMusic.AUTHOR_ID)
+    stream_data = VCMusic.StreamRecord(url=url, duration=duration)
+    return [
+        VCMusic.SongRequest(
+            raw_request=url,
+            request_type=VCMusic.SongRequestType.YOUTUBE_VIDEO,
+            request_member=member,
+            url=url,
+            title="Benchmark Song",
+            stream_data=stream_data,
+        )
+        for _ in range(count)
+    ]
+
+
+def ffmpeg_cpu_seconds() -> float:
+    """The CPU time used so far by the running ffmpeg processes, read from /proc."""
+    ticks = os.sysconf("SC_CLK_TCK")
+    total = 0.0
+    for pid in list(VCMusic.FFMPEG_SUPERVISOR.processes):
+        try:
+            with open(f"/proc/{pid}/stat") as file:
+                fields = file.read().rsplit(")", 1)[1].split()
+            total += (int(fields[11]) + int(fields[12])) / ticks
+        except (OSError, IndexError, ValueError):
+            pass
+    return total
+
+
+def percentiles(values: list[float]) -> list[float]:
+    """Get the 1st to 99th percentiles of the values, interpolated between the observed values so that
+    no percentile is above the largest value observed."""
+    if len(values) < 2:
+        return [max(values, default=0)] * 99
+    return quantiles(values, n=100, method="inclusive")
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list[float]):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.05)
+        lags.append(time.perf_counter() - started - 0.05)
+
+
+async def measure(
+    cog: VCMusic.VCMusic, url: str, duration: float, guilds: int, seconds: float
+):
+    lateness: list[float] = []
+    lags: list[float] = []
+    guild_ids = list(range(1000, 1000 + guilds))
+
+    for guild_id in guild_ids:
+        active_player = VCMusic.GuildMusicPlayer(
+            guild=FakeGuild(guild_id), voice_client=FakeVoiceClient(lateness)
+        )
+        active_player.queue.extend(make_songs(url, duration, 10))
+        cog.active_players[guild_id] = active_player
+        await cog.play_next_song(guild_id)
+
+    # Let ffmpeg start before measuring
+    await asyncio.sleep(1)
+    lateness.clear()
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop, lags))
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    ffmpeg_before = ffmpeg_cpu_seconds()
+
+    await asyncio.sleep(seconds)
+
+    usage_after = resource.getrusage(resource.RUSAGE_SELF)
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    ffmpeg_after = ffmpeg_cpu_seconds()
+    stop.set()
+    await lag_task
+
+    for guild_id in guild_ids:
+        cog.active_players[guild_id].voice_client.stop()
+        await cog.cleanup_after_disconnect(guild_id)
+
+    bot_cpu = (usage_after.ru_utime + usage_after.ru_stime) - (
+        usage_before.ru_utime + usage_before.ru_stime
+    )
+    ffmpeg_cpu = (
+        ffmpeg_after
+        - ffmpeg_before
+        + (children_after.ru_utime + children_after.ru_stime)
+        - (children_before.ru_utime + children_before.ru_stime)
+    )
+    jitter = percentiles(lateness)
+    loop_lag = percentiles(lags)
+    return (
+        bot_cpu / seconds / guilds,
+        max(ffmpeg_cpu, 0) / seconds / guilds,
+        jitter[49],
+        jitter[98],
+        loop_lag[98],
+        max(lags, default=0),
+    )
+
+
+async def run(args: argparse.Namespace):
+    app = web.Application()
+    app.router.add_static("/", os.path.dirname(os.path.abspath(args.audio_file)))
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", BENCHMARK_PORT).start()
+    url = f"http://127.0.0.1:{BENCHMARK_PORT}/{os.path.basename(args.audio_file)}"
+
+    cog = VCMusic.VCMusic(FakeBot(asyncio.get_running_loop()))
+
+    async def update_embed(guild_id: int) -> bool:
+        return True
+
+    # There are no music channels to update in the benchmark
+    cog.update_embed = update_embed
+
+    print(
+        f"{'guilds':>6}{'bot cpu/stream':>16}{'ffmpeg cpu/stream':>19}"
+        f"{'jitter p50':>12}{'jitter p99':>12}{'loop lag p99':>14}{'loop lag max':>14}"
+    )
+    try:
+        for guilds in args.guilds:
+            bot_cpu, ffmpeg_cpu, jitter_50, jitter_99, lag_99, lag_max = await measure(
+                cog, url, args.duration, guilds, args.seconds
+            )
+            print(
+                f"{guilds:>6}{bot_cpu:>15.2%}{ffmpeg_cpu:>18.2%}"
+                f"{jitter_50 * 1000:>10.2f}ms{jitter_99 * 1000:>10.2f}ms"
+                f"{lag_99 * 1000:>12.2f}ms{lag_max * 1000:>12.2f}ms"
+            )
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("audio_file")
+    parser.add_argument("--guilds", type=int, nargs="+", default=[1, 10, 25, 50])
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=180,
+        help="The duration of the audio file in seconds, used to schedule preloading.",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
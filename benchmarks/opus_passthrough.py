@@ -0,0 +1,88 @@
+"""Compare the CPU cost per concurrent stream of the PCM and Opus passthrough playback modes of VCMusic.
+
+Each stream reads frames from a MusicAudioSource at the same 20ms rate as a discord.py AudioPlayer, and encodes
+the frames to Opus in Python when the source is not already Opus, just as the AudioPlayer would.
+
+Usage:
+    python benchmarks/opus_passthrough.py <audio-file> [--streams 1 5 10 20] [--seconds 10]
+"""
+
+import argparse
+import os
+import resource
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("DB_OVERRIDE", "sqlite://")
+os.environ.setdefault("GOOGLE_API", "benchmark")
+
+from discord.opus import Encoder  # noqa: E402
+
+import extensions.VCMusic as VCMusic  # noqa: E402
+
+
+def run_stream(source: VCMusic.MusicAudioSource, stop: threading.Event):
+    encoder = None if source.is_opus() else Encoder()
+    next_frame = time.perf_counter()
+    while not stop.is_set():
+        data = source.read()
+        if not data:
+            break
+        if encoder:
+            encoder.encode(data, Encoder.SAMPLES_PER_FRAME)
+        next_frame += VCMusic.MusicAudioSource.FRAME_LENGTH
+        time.sleep(max(0, next_frame - time.perf_counter()))
+
+
+def measure(audio_file: str, passthrough: bool, streams: int, seconds: float):
+    VCMusic.OPUS_PASSTHROUGH = passthrough
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_before = time.process_time()
+
+    stop = threading.Event()
+    sources = [
+        VCMusic.MusicAudioSource(audio_file, volume=80, is_stream=False, codec="opus")
+        for _ in range(streams)
+    ]
+    threads = [
+        threading.Thread(target=run_stream, args=(x, stop), daemon=True)
+        for x in sources
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    cpu_main = time.process_time() - cpu_before
+    for source in sources:
+        source.cleanup()
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_children = (children_after.ru_utime + children_after.ru_stime) - (
+        children_before.ru_utime + children_before.ru_stime
+    )
+    return cpu_main / seconds / streams, cpu_children / seconds / streams
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("audio_file")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'streams':>8}{'bot cpu/stream':>16}{'ffmpeg cpu/stream':>19}")
+    for passthrough in (False, True):
+        mode = "opus" if passthrough else "pcm"
+        for streams in args.streams:
+            main_cpu, child_cpu = measure(
+                args.audio_file, passthrough, streams, args.seconds
+            )
+            print(f"{mode:<12}{streams:>8}{main_cpu:>15.2%}{child_cpu:>18.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure the memory used by a queue of songs in VCMusic, comparing a list of SongRequest objects with a SongQueue.
+
+Usage:
+    python benchmarks/queue_memory.py [--songs 5000]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("DB_OVERRIDE", "sqlite://")
+os.environ.setdefault("GOOGLE_API", "benchmark")
+
+from discord import Object  # noqa: E402
+
+import extensions.VCMusic as VCMusic  # noqa: E402
+
+
+def make_songs(count: int) -> list[VCMusic.SongRequest]:
+    member = Object(id=244050529271939073)
+    return [
+        VCMusic.SongRequest(
+            raw_request="https://www.youtube.com/playlist?list=PLbenchmark",
+            request_type=VCMusic.SongRequestType.YOUTUBE_VIDEO,
+            request_member=member,
+            url=f"https://youtube.com/watch?v={idx:011d}",
+            title=f"Benchmark Artist - Benchmark Song Number {idx} (Official Video)",
+            thumbnail=f"https://i.ytimg.com/vi/{idx:011d}/maxresdefault.jpg",
+        )
+        for idx in range(count)
+    ]
+
+
+def measure(case: str, songs: int) -> int:
+    """Measure the memory used by one way of storing a queue. Each case is measured in a new process, so that
+    memory kept by the interpreter from an earlier case, such as the table of interned strings, is not counted.
+    """
+    if case == "evicted":
+        VCMusic.TRACK_METADATA.max_entries = 0
+
+    tracemalloc.start()
+    if case == "list":
+        result = make_songs(songs)
+    else:
+        result = VCMusic.SongQueue()
+        result.extend(make_songs(songs))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--songs", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = {}
+    for case in ("list", "cached", "evicted"):
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results[case] = executor.submit(measure, case, args.songs).result()
+
+    print(f"list[SongRequest]:                {results['list'] / 1024:>10.1f} KiB")
+    print(
+        f"SongQueue + cached metadata:      {results['cached'] / 1024:>10.1f} KiB "
+        f"(at most {VCMusic.METADATA_CACHE_SIZE} songs cached)"
+    )
+    print(f"SongQueue (metadata evicted):     {results['evicted'] / 1024:>10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure the time taken to drain, edit and reorder a queue of songs in VCMusic, comparing a list with a SongQueue.
+
+Usage:
+    python benchmarks/queue_operations.py [--songs 5000] [--edits 1000] [--repeat 5]
+
+Each measurement is the fastest of --repeat runs.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("DB_OVERRIDE", "sqlite://")
+os.environ.setdefault("GOOGLE_API", "benchmark")
+
+from discord import Object  # noqa: E402
+
+import extensions.VCMusic as VCMusic  # noqa: E402
+
+
+def make_songs(count: int) -> list[VCMusic.SongRequest]:
+    member = Object(id=244050529271939073)
+    return [
+        VCMusic.SongRequest(
+            raw_request="https://www.youtube.com/playlist?list=PLbenchmark",
+            request_type=VCMusic.SongRequestType.YOUTUBE_VIDEO,
+            request_member=member,
+            url=f"https://youtube.com/watch?v={idx:011d}",
+        )
+        for idx in range(count)
+    ]
+
+
+def make_edits(songs: int, edits: int) -> list[tuple[int, int]]:
+    rng = random.Random(0)
+    return [(rng.randrange(songs), rng.randrange(songs)) for _ in range(edits)]
+
+
+def time_list(songs: list[VCMusic.SongRequest], edits: list[tuple[int, int]]):
+    queue = list(songs)
+    start = time.perf_counter()
+    for index, new_index in edits:
+        queue.insert(new_index, queue.pop(index))
+    edited = time.perf_counter()
+    while queue:
+        queue.pop(0)
+    return edited - start, time.perf_counter() - edited
+
+
+def time_song_queue(songs: list[VCMusic.SongRequest], edits: list[tuple[int, int]]):
+    queue = VCMusic.SongQueue()
+    queue.extend(songs)
+    start = time.perf_counter()
+    for index, new_index in edits:
+        queue.move(index, new_index)
+    edited = time.perf_counter()
+    while queue:
+        queue.pop()
+    return edited - start, time.perf_counter() - edited
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--songs", type=int, default=5000)
+    parser.add_argument("--edits", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    songs = make_songs(args.songs)
+    edits = make_edits(args.songs, args.edits)
+
+    for name, runner in (("list", time_list), ("SongQueue", time_song_queue)):
+        times = [runner(songs, edits) for _ in range(args.repeat)]
+        edit_time = min(x for x, _ in times)
+        drain_time = min(x for _, x in times)
+        print(
+            f"{name:<10} {args.edits} moves: {edit_time * 1000:>8.2f} ms, "
+            f"drain {args.songs} songs: {drain_time * 1000:>8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Count the Discord API calls made by /vc lock and /vc unlock in VoiceAdmin for child Voice Channels of different
+sizes, comparing a call per permission overwrite with the overwrites being applied in a single edit.
+
+Each call to the fake Voice Channel is counted instead of being sent to Discord, including the renames that are
+applied in the background once the command has returned. Each Voice Channel is renamed within its rename limit, so
+the lock icon is sent in the same edit as the overwrites.
+
+Usage:
+    python benchmarks/voice_lock_calls.py [--members 1 5 20 50] [--overwrites 3]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("DB_OVERRIDE", "sqlite://")
+
+from discord import Object, PermissionOverwrite  # noqa: E402
+
+import extensions.VoiceAdmin as VoiceAdmin  # noqa: E402
+from database.gateway import DBSession  # noqa: E402
+from database.models import VoiceAdminChild  # noqa: E402
+
+
+class FakeGuild:
+    def __init__(self):
+        self.id = 1
+        self.name = "Benchmark Guild"
+        self.default_role = Object(id=1)
+        self.me = Object(id=2)
+        self.me.top_role = Object(id=3)
+
+
+class FakeVoiceChannel:
+    """Counts the calls that would each be a request to Discord."""
+
+    def __init__(
+        self, channel_id: int, guild: FakeGuild, members: list[Object], overwrites: int
+    ):
+        self.id = channel_id
+        self.guild = guild
+        self.name = "Benchmark's VC"
+        self.category = None
+        self.members = members
+        self.overwrites = {
+            Object(id=100 + x): PermissionOverwrite(view_channel=True)
+            for x in range(overwrites)
+        }
+        self.permissions_synced = False
+        self.calls = 0
+
+    async def set_permissions(self, target, *, overwrite=None, **permissions):
+        self.calls += 1
+
+    async def edit(self, **options):
+        self.calls += 1
+        if "overwrites" in options:
+            self.overwrites = options["overwrites"]
+        if "name" in options:
+            self.name = options["name"]
+
+
+class FakeFollowup:
+    async def send(self, *args, **kwargs):
+        pass
+
+
+class FakeResponse:
+    async def defer(self, *args, **kwargs):
+        pass
+
+
+class FakeInteraction:
+    def __init__(self, user: Object):
+        self.user = user
+        self.response = FakeResponse()
+        self.followup = FakeFollowup()
+
+
+async def lock_per_overwrite(voice_channel: FakeVoiceChannel):
+    """Lock a Voice Channel by setting each permission overwrite with its own call."""
+    current_perms = voice_channel.overwrites
+    await voice_channel.set_permissions(
+        voice_channel.guild.me.top_role,
+        connect=True,
+        view_channel=True,
+        manage_channels=True,
+        manage_permissions=True,
+    )
+    for group, permission in current_perms.items():
+        await voice_channel.set_permissions(group, overwrite=permission)
+    await voice_channel.set_permissions(
+        voice_channel.guild.default_role,
+        overwrite=PermissionOverwrite(speak=False, connect=False),
+    )
+    for member in voice_channel.members:
+        await voice_channel.set_permissions(
+            member, connect=True, speak=True, view_channel=True
+        )
+    await voice_channel.edit(name=voice_channel.name)
+
+
+async def unlock_per_overwrite(voice_channel: FakeVoiceChannel):
+    await voice_channel.edit(name=voice_channel.name, sync_permissions=True)
+    await voice_channel.set_permissions(
+        voice_channel.guild.default_role, overwrite=None
+    )
+
+
+async def count_calls(cog: VoiceAdmin.VoiceAdminUser, members: int, overwrites: int):
+    guild = FakeGuild()
+    users = [Object(id=1000 + x) for x in range(members)]
+
+    voice_channel = FakeVoiceChannel(members, guild, users, overwrites)
+    await lock_per_overwrite(voice_channel)
+    lock_before = voice_channel.calls
+    voice_channel.calls = 0
+    await unlock_per_overwrite(voice_channel)
+    unlock_before = voice_channel.calls
+
+    voice_channel = FakeVoiceChannel(members, guild, users, overwrites)
+    owner = users[0]
+    owner.voice = Object(id=0)
+    owner.voice.channel = voice_channel
+    DBSession.create(
+        VoiceAdminChild(
+            primary_key=members,
+            guild_id=guild.id,
+            channel_id=voice_channel.id,
+            owner_id=owner.id,
+            is_locked=False,
+            is_limited=False,
+            has_custom_name=False,
+        )
+    )
+    VoiceAdmin.VOICE_ADMIN_INDEX.set_child(voice_channel.id, owner.id)
+
+    await cog.lock_channel.callback(cog, FakeInteraction(owner))
+    await asyncio.gather(*VoiceAdmin.CHANNEL_RENAMER.tasks.values())
+    lock_after = voice_channel.calls
+    voice_channel.calls = 0
+    await cog.unlock_channel.callback(cog, FakeInteraction(owner))
+    await asyncio.gather(*VoiceAdmin.CHANNEL_RENAMER.tasks.values())
+    unlock_after = voice_channel.calls
+
+    DBSession.delete(
+        DBSession.get(VoiceAdminChild, guild_id=guild.id, channel_id=voice_channel.id)
+    )
+    VoiceAdmin.VOICE_ADMIN_INDEX.remove_child(voice_channel.id)
+    VoiceAdmin.CHANNEL_RENAMER.forget(voice_channel.id)
+    return lock_before, lock_after, unlock_before, unlock_after
+
+
+async def run(args: argparse.Namespace):
+    cog = VoiceAdmin.VoiceAdminUser(Object(id=0))
+    print(
+        f"{'members':>8}{'lock calls (before)':>21}{'lock calls (after)':>20}"
+        f"{'unlock calls (before)':>23}{'unlock calls (after)':>22}"
+    )
+    for members in args.members:
+        lock_before, lock_after, unlock_before, unlock_after = await count_calls(
+            cog, members, args.overwrites
+        )
+        print(
+            f"{members:>8}{lock_before:>21}{lock_after:>20}"
+            f"{unlock_before:>23}{unlock_after:>22}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, nargs="+", default=[1, 5, 20, 50])
+    parser.add_argument(
+        "--overwrites",
+        type=int,
+        default=3,
+        help="The number of permission overwrites the Voice Channel has before it is locked.",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
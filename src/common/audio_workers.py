@@ -0,0 +1,236 @@
+import logging
+import multiprocessing
+from itertools import count
+from multiprocessing.connection import Connection
+from threading import Lock, Thread
+
+from discord import FFmpegPCMAudio, PCMVolumeTransformer
+from discord.opus import Encoder
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPipeline(Thread):
+    """Runs inside a worker process. Decodes a source with ffmpeg, applies the volume and encodes the audio to
+    Opus, sending each encoded frame back to the bot over a connection. Sending blocks once the connection is
+    full, so the pipeline only runs as far ahead of playback as the connection can buffer.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        source: str,
+        before_options: str,
+        options: str,
+        volume: float,
+    ):
+        super().__init__(daemon=True)
+        self.connection = connection
+        self.audio = PCMVolumeTransformer(
+            FFmpegPCMAudio(source, before_options=before_options, options=options),
+            volume=volume,
+        )
+        self.encoder = Encoder()
+
+    def set_volume(self, volume: float):
+        self.audio.volume = volume
+
+    def run(self):
+        try:
+            while True:
+                data = self.audio.read()
+                if not data:
+                    break
+                self.connection.send_bytes(
+                    self.encoder.encode(data, Encoder.SAMPLES_PER_FRAME)
+                )
+            self.connection.send_bytes(b"")
+        except (OSError, EOFError):
+            # The bot has stopped reading from this pipeline
+            pass
+        finally:
+            self.audio.cleanup()
+            self.connection.close()
+
+
+def run_audio_worker(commands: Connection):
+    """The entry point of a worker process. Runs audio pipelines as requested by the bot until the command
+    connection is closed.
+
+    Args:
+        commands (Connection): The connection on which commands are received from the bot.
+    """
+    pipelines: dict[int, WorkerPipeline] = {}
+    while True:
+        try:
+            message = commands.recv()
+        except (EOFError, OSError):
+            break
+
+        for pipeline_id in [x for x, y in pipelines.items() if not y.is_alive()]:
+            pipelines.pop(pipeline_id)
+
+        match message:
+            case (
+                "open",
+                pipeline_id,
+                connection,
+                source,
+                before_options,
+                options,
+                volume,
+            ):
+                try:
+                    pipeline = WorkerPipeline(
+                        connection, source, before_options, options, volume
+                    )
+                except Exception as e:
+                    logger.error(f"Unable to start audio pipeline for {source} - {e}")
+                    connection.close()
+                    continue
+                pipelines[pipeline_id] = pipeline
+                pipeline.start()
+            case ("volume", pipeline_id, volume):
+                if pipeline_id in pipelines:
+                    pipelines[pipeline_id].set_volume(volume)
+            case ("close", pipeline_id):
+                pipeline = pipelines.pop(pipeline_id, None)
+                if pipeline:
+                    pipeline.audio.cleanup()
+
+    for pipeline in pipelines.values():
+        pipeline.audio.cleanup()
+
+
+class WorkerAudio:
+    """The bot's side of an audio pipeline running in a worker process. Gives already encoded Opus frames,
+    so that no decoding, volume scaling or encoding happens in the bot's process.
+    """
+
+    def __init__(
+        self,
+        pool: "AudioWorkerPool",
+        worker: int,
+        pipeline_id: int,
+        connection: Connection,
+    ):
+        self.pool = pool
+        self.worker = worker
+        self.pipeline_id = pipeline_id
+        self.connection = connection
+        self._volume = 1.0
+        self.closed = False
+
+    @property
+    def volume(self) -> float:
+        return self._volume
+
+    @volume.setter
+    def volume(self, value: float):
+        self._volume = value
+        self.pool.send(self.worker, ("volume", self.pipeline_id, value))
+
+    def read(self) -> bytes:
+        try:
+            return self.connection.recv_bytes()
+        except (EOFError, OSError):
+            return b""
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.connection.close()
+        self.pool.release(self.worker, self.pipeline_id)
+
+
+class AudioWorkerPool:
+    """A pool of worker processes that run audio pipelines, so that the CPU used to decode, scale and encode audio
+    is spread across multiple cores instead of contending with the bot's event loop. Each pipeline is assigned to
+    the worker with the fewest pipelines, and workers that have died are restarted when a pipeline is opened.
+    """
+
+    def __init__(self, workers: int):
+        self.context = multiprocessing.get_context("spawn")
+        self.processes: list[multiprocessing.Process] = [None] * workers
+        self.commands: list[Connection] = [None] * workers
+        self.loads = [0] * workers
+        self.pipeline_ids = count()
+        self.lock = Lock()
+
+    def start_worker(self, worker: int):
+        parent_connection, child_connection = self.context.Pipe()
+        process = self.context.Process(
+            target=run_audio_worker,
+            args=(child_connection,),
+            name=f"audio-worker-{worker}",
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        self.processes[worker] = process
+        self.commands[worker] = parent_connection
+        self.loads[worker] = 0
+
+    def send(self, worker: int, message: tuple):
+        with self.lock:
+            try:
+                self.commands[worker].send(message)
+            except (OSError, AttributeError) as e:
+                logger.warning(
+                    f"Unable to send {message[0]} to audio worker {worker} - {e}"
+                )
+
+    def open(
+        self, source: str, before_options: str, options: str, volume: float
+    ) -> WorkerAudio:
+        """Start an audio pipeline for a source in the least busy worker.
+
+        Args:
+            source (str): The URL or path of the audio source.
+            before_options (str): The ffmpeg options to apply before the input.
+            options (str): The ffmpeg options to apply to the output.
+            volume (float): The volume to apply, where 1 is the original volume.
+
+        Returns:
+            WorkerAudio: The pipeline, from which Opus frames can be read.
+        """
+        receiver, sender = self.context.Pipe(duplex=False)
+        with self.lock:
+            worker = self.loads.index(min(self.loads))
+            if self.processes[worker] is None or not self.processes[worker].is_alive():
+                if self.processes[worker] is not None:
+                    logger.warning(f"Audio worker {worker} died, restarting it")
+                self.start_worker(worker)
+            pipeline_id = next(self.pipeline_ids)
+            self.loads[worker] += 1
+            self.commands[worker].send(
+                ("open", pipeline_id, sender, source, before_options, options, volume)
+            )
+        sender.close()
+
+        audio = WorkerAudio(self, worker, pipeline_id, receiver)
+        audio._volume = volume
+        return audio
+
+    def release(self, worker: int, pipeline_id: int):
+        with self.lock:
+            self.loads[worker] = max(0, self.loads[worker] - 1)
+        self.send(worker, ("close", pipeline_id))
+
+    def close(self):
+        """Stop every worker, ending all of their pipelines."""
+        with self.lock:
+            for connection in self.commands:
+                if connection is not None:
+                    connection.close()
+            for process in self.processes:
+                if process is not None:
+                    process.join(timeout=5)
+                    if process.is_alive():
+                        process.kill()
+            self.processes = [None] * len(self.processes)
+            self.commands = [None] * len(self.commands)
@@ -1,5 +1,7 @@
 import re
+from collections import Counter
 from datetime import datetime
+from enum import IntEnum
 from typing import Any, List, Union
 
 from discord import (
@@ -10,6 +12,7 @@ from discord import (
     ScheduledEvent,
     Guild,
     PartialEmoji,
+    VoiceState,
 )
 from discord.abc import GuildChannel
 from discord.app_commands import Choice, Transformer
@@ -78,6 +81,40 @@ def primary_key_from_object(object: Union[Role, GuildChannel, ScheduledEvent, Me
     return int(f"{object.guild.id % 1000}{object.id % 1000}")
 
 
+class VoiceEvent(IntEnum):
+    NOOP = 0
+    JOIN = 1
+    LEAVE = 2
+    MOVE = 3
+
+
+class VoiceEventClassifier:
+    """Sorts voice state updates by how the member's channel changed, so that listeners can skip updates
+    where only the mute, deafen or stream state changed. Counts how many of each kind have been seen.
+    """
+
+    def __init__(self):
+        self.counts: Counter[VoiceEvent] = Counter()
+
+    def classify(self, before: VoiceState, after: VoiceState) -> VoiceEvent:
+        before_id = before.channel.id if before.channel else None
+        after_id = after.channel.id if after.channel else None
+        if before_id == after_id:
+            event = VoiceEvent.NOOP
+        elif before_id is None:
+            event = VoiceEvent.JOIN
+        elif after_id is None:
+            event = VoiceEvent.LEAVE
+        else:
+            event = VoiceEvent.MOVE
+        self.counts[event] += 1
+        return event
+
+    @property
+    def skipped(self) -> int:
+        return self.counts[VoiceEvent.NOOP]
+
+
 class ColourTransformer(Transformer):
     """The transformer that provides named colour autocompletion and converts the corresponding Color object.
     Also provides the ability to convert a hex colour string to a Color object from the given string.
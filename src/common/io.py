@@ -1,8 +1,11 @@
 import csv
+import json
 import logging
 import math
 import os
 import subprocess
+from collections import OrderedDict
+from threading import Lock
 from typing import Dict
 from uuid import uuid4
 
@@ -150,3 +153,297 @@ def reduce_video(video_file: str, output_file: str | None = None) -> str | None:
         return video_file
     except subprocess.CalledProcessError:
         return None
+
+
+def transcode_audio_to_opus(
+    source_url: str,
+    output_file: str,
+    before_options: str = "",
+    headers: dict[str, str] | None = None,
+) -> str | None:
+    """Transcode the audio of a given source into an Ogg/Opus file using ffmpeg.
+
+    Args:
+        source_url (str): The URL or path of the audio source.
+        output_file (str): The path of the Opus file to create.
+        before_options (str, optional): Extra ffmpeg options to apply before the input. Defaults to "".
+        headers (dict[str, str] | None, optional): The HTTP headers to request the source with. Defaults to None.
+
+    Returns:
+        str | None: The path of the created file, or None if the transcode failed.
+    """
+    temp_file = f"{output_file}.{uuid4()}.part"
+    try:
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-loglevel",
+                "error",
+                *before_options.split(),
+                *ffmpeg_header_args(headers),
+                "-i",
+                source_url,
+                "-vn",
+                "-c:a",
+                "libopus",
+                "-b:a",
+                "128k",
+                "-f",
+                "opus",
+                temp_file,
+            ],
+            check=True,
+            stdin=subprocess.DEVNULL,
+        )
+        os.replace(temp_file, output_file)
+        return output_file
+    except (subprocess.CalledProcessError, OSError):
+        logger.warning(f"Unable to transcode audio for {output_file}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        return None
+
+
+def ffmpeg_header_args(headers: dict[str, str] | None) -> list[str]:
+    """Get the ffmpeg arguments that send the given HTTP headers when requesting an input.
+
+    Args:
+        headers (dict[str, str] | None): The HTTP headers to send, if any.
+
+    Returns:
+        list[str]: The arguments to place before the input.
+    """
+    if not headers:
+        return []
+    return [
+        "-headers",
+        "".join(f"{key}: {value}\r\n" for key, value in headers.items()),
+    ]
+
+
+def measure_loudness(
+    source_url: str, before_options: str = "", headers: dict[str, str] | None = None
+) -> float | None:
+    """Measure the integrated loudness of a given audio source as per EBU R128 using ffmpeg. The whole
+    source is decoded, so this is blocking and should be run off the event loop.
+
+    Args:
+        source_url (str): The URL or path of the audio source.
+        before_options (str, optional): Extra ffmpeg options to apply before the input. Defaults to "".
+        headers (dict[str, str] | None, optional): The HTTP headers to request the source with. Defaults to None.
+
+    Returns:
+        float | None: The integrated loudness in LUFS, or None if it could not be measured.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-nostats",
+                *before_options.split(),
+                *ffmpeg_header_args(headers),
+                "-i",
+                source_url,
+                "-vn",
+                "-af",
+                "loudnorm=print_format=json",
+                "-f",
+                "null",
+                "-",
+            ],
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        output = result.stderr
+        stats = json.loads(output[output.rindex("{") : output.rindex("}") + 1])
+        loudness = float(stats.get("input_i"))
+    except (subprocess.CalledProcessError, OSError, ValueError, TypeError):
+        logger.warning(f"Unable to measure loudness of {source_url}")
+        return None
+
+    if not math.isfinite(loudness):
+        return None
+    return loudness
+
+
+class AudioCache:
+    """A byte-budgeted LRU cache of Opus audio files stored on disk, keyed by YouTube video ID.
+
+    Files are only added to the cache once they have been played `min_plays` times, and the least
+    recently played files are evicted once the total size of the cache exceeds `max_bytes`. Play counts
+    are kept for at most `max_tracked` uncached videos, forgetting the least recently played first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int,
+        min_plays: int = 3,
+        max_tracked: int = 10000,
+    ):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.min_plays = min_plays
+        self.max_tracked = max_tracked
+        self.play_counts: OrderedDict[str, int] = OrderedDict()
+        self.pending: set[str] = set()
+        self.entries: OrderedDict[str, int] = OrderedDict()
+        self.total_bytes = 0
+        self.lock = Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        files = [
+            x
+            for x in os.scandir(self.cache_dir)
+            if x.is_file() and x.name.endswith(".opus")
+        ]
+        for file in sorted(files, key=lambda x: x.stat().st_atime):
+            size = file.stat().st_size
+            self.entries[file.name[: -len(".opus")]] = size
+            self.total_bytes += size
+        self.evict()
+
+    def path_for(self, video_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{video_id}.opus")
+
+    def get(self, video_id: str) -> str | None:
+        """Get the path of the cached file for a given video, marking it as recently used.
+
+        Args:
+            video_id (str): The ID of the video.
+
+        Returns:
+            str | None: The path of the cached Opus file if it exists, else None.
+        """
+        with self.lock:
+            if video_id not in self.entries:
+                return None
+            self.entries.move_to_end(video_id)
+        return self.path_for(video_id)
+
+    def record_play(self, video_id: str) -> bool:
+        """Record that a video has been played.
+
+        Args:
+            video_id (str): The ID of the video played.
+
+        Returns:
+            bool: True if the video should now be added to the cache, else False.
+        """
+        with self.lock:
+            if video_id in self.entries or video_id in self.pending:
+                return False
+            plays = self.play_counts.pop(video_id, 0) + 1
+            if plays < self.min_plays:
+                self.play_counts[video_id] = plays
+                while len(self.play_counts) > self.max_tracked:
+                    self.play_counts.popitem(last=False)
+                return False
+            self.pending.add(video_id)
+            return True
+
+    def store(
+        self,
+        video_id: str,
+        source_url: str,
+        before_options: str = "",
+        headers: dict[str, str] | None = None,
+    ) -> bool:
+        """Transcode the given source into the cache. This is blocking and should be run off the event loop.
+
+        Args:
+            video_id (str): The ID of the video being stored.
+            source_url (str): The URL to transcode the audio from.
+            before_options (str, optional): Extra ffmpeg options to apply before the input. Defaults to "".
+            headers (dict[str, str] | None, optional): The HTTP headers to request the source with. Defaults to None.
+
+        Returns:
+            bool: If the file was added to the cache.
+        """
+        try:
+            output_file = transcode_audio_to_opus(
+                source_url, self.path_for(video_id), before_options, headers
+            )
+            if output_file is None:
+                return False
+            size = os.path.getsize(output_file)
+            with self.lock:
+                self.entries[video_id] = size
+                self.total_bytes += size
+            self.evict()
+            return True
+        finally:
+            with self.lock:
+                self.pending.discard(video_id)
+
+    def evict(self):
+        """Remove the least recently used files until the cache is within its byte budget."""
+        with self.lock:
+            while self.entries and self.total_bytes > self.max_bytes:
+                video_id, size = self.entries.popitem(last=False)
+                self.total_bytes -= size
+                try:
+                    os.remove(self.path_for(video_id))
+                except FileNotFoundError:
+                    pass
+
+
+class SnapshotStore:
+    """Stores small JSON snapshots of state on disk, with one file per key. Files are written
+    atomically, so that a crash during a write never leaves a partial snapshot behind.
+
+    All methods are blocking and should be run off the event loop.
+    """
+
+    def __init__(self, state_dir: str):
+        self.state_dir = os.path.abspath(state_dir)
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def path_for(self, key: int | str) -> str:
+        return os.path.join(self.state_dir, f"{key}.json")
+
+    def save(self, snapshots: dict[int | str, dict]):
+        """Write the given snapshots, replacing any existing snapshots with the same keys.
+
+        Args:
+            snapshots (dict[int | str, dict]): The snapshots to write, keyed by their name.
+        """
+        for key, data in snapshots.items():
+            path = self.path_for(key)
+            temp_file = f"{path}.part"
+            with open(temp_file, "w") as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.replace(temp_file, path)
+
+    def delete(self, keys: list[int | str]):
+        """Remove the snapshots with the given keys, if they exist.
+
+        Args:
+            keys (list[int | str]): The keys of the snapshots to remove.
+        """
+        for key in keys:
+            try:
+                os.remove(self.path_for(key))
+            except FileNotFoundError:
+                pass
+
+    def load_all(self) -> dict[str, dict]:
+        """Load every snapshot in the state directory. Snapshots that cannot be read are skipped.
+
+        Returns:
+            dict[str, dict]: The snapshots, keyed by their name.
+        """
+        snapshots = {}
+        for entry in os.scandir(self.state_dir):
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path, "r") as file:
+                    snapshots[entry.name[: -len(".json")]] = json.load(file)
+            except (OSError, ValueError):
+                logger.warning(f"Unable to load snapshot {entry.path}")
+        return snapshots
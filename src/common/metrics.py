@@ -0,0 +1,152 @@
+import logging
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable
+
+from aiohttp import web
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Counts observed values into a fixed set of buckets, in the same way as a Prometheus histogram."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """A collection of counters, histograms and gauges that can be labelled by guild and rendered in the
+    Prometheus text format. Counters and histograms can be updated from any thread.
+    """
+
+    def __init__(self, prefix: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self.counters: dict[str, dict[str, int]] = {}
+        self.histograms: dict[str, dict[str, Histogram]] = {}
+        self.gauges: dict[str, Callable[[], dict[str, float]]] = {}
+        self.lock = Lock()
+
+    def increment(self, name: str, guild_id: int = None, value: int = 1):
+        """Increase a counter.
+
+        Args:
+            name (str): The name of the counter.
+            guild_id (int, optional): The ID of the guild to count against. Defaults to None.
+            value (int, optional): The amount to increase the counter by. Defaults to 1.
+        """
+        label = "" if guild_id is None else str(guild_id)
+        with self.lock:
+            counter = self.counters.setdefault(name, {})
+            counter[label] = counter.get(label, 0) + value
+
+    def observe(self, name: str, value: float, guild_id: int = None):
+        """Record a value in a histogram, such as the number of seconds taken by a stage of playback.
+
+        Args:
+            name (str): The name of the histogram.
+            value (float): The value to record.
+            guild_id (int, optional): The ID of the guild to record against. Defaults to None.
+        """
+        label = "" if guild_id is None else str(guild_id)
+        with self.lock:
+            histograms = self.histograms.setdefault(name, {})
+            if label not in histograms:
+                histograms[label] = Histogram(self.buckets)
+            histograms[label].observe(value)
+
+    def gauge(self, name: str, callback: Callable[[], dict[str, float]]):
+        """Register a gauge whose values are read when the metrics are rendered.
+
+        Args:
+            name (str): The name of the gauge.
+            callback (Callable[[], dict[str, float]]): Gives the value of the gauge for each guild ID, with an
+            empty string used for a value that is not specific to a guild.
+        """
+        self.gauges[name] = callback
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format.
+
+        Returns:
+            str: The metrics as text.
+        """
+
+        def labels(guild: str, extra: str = "") -> str:
+            parts = [x for x in (f'guild="{guild}"' if guild else "", extra) if x]
+            return f"{{{','.join(parts)}}}" if parts else ""
+
+        lines = []
+        with self.lock:
+            for name, counter in self.counters.items():
+                metric = f"{self.prefix}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for guild, value in counter.items():
+                    lines.append(f"{metric}{labels(guild)} {value}")
+
+            for name, histograms in self.histograms.items():
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for guild, histogram in histograms.items():
+                    cumulative = 0
+                    for bucket, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        bucket_label = labels(guild, f'le="{bucket}"')
+                        lines.append(f"{metric}_bucket{bucket_label} {cumulative}")
+                    inf_label = labels(guild, 'le="+Inf"')
+                    lines.append(f"{metric}_bucket{inf_label} {histogram.count}")
+                    lines.append(f"{metric}_sum{labels(guild)} {histogram.total}")
+                    lines.append(f"{metric}_count{labels(guild)} {histogram.count}")
+
+        for name, callback in self.gauges.items():
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {metric} gauge")
+            try:
+                values = callback()
+            except Exception as e:
+                logger.warning(f"Unable to read gauge {metric} - {e}")
+                continue
+            for guild, value in values.items():
+                lines.append(f"{metric}{labels(guild)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+async def start_metrics_server(
+    registry: MetricsRegistry, port: int, host: str = "127.0.0.1"
+) -> web.AppRunner:
+    """Serve the metrics of a registry over HTTP at /metrics.
+
+    Args:
+        registry (MetricsRegistry): The registry to serve.
+        port (int): The port to listen on.
+        host (str, optional): The address to listen on. Defaults to "127.0.0.1".
+
+    Returns:
+        web.AppRunner: The runner of the server, which should be cleaned up to stop the server.
+    """
+
+    async def handle_metrics(request: web.Request) -> web.Response:
+        return web.Response(text=registry.render(), content_type="text/plain")
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"Serving {registry.prefix} metrics on {host}:{port}")
+    return runner
@@ -0,0 +1,130 @@
+import logging
+import os
+import subprocess
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SupervisedProcess:
+    process: subprocess.Popen
+    key: int
+    started: float
+
+
+class ProcessSupervisor:
+    """Keeps track of long running subprocesses, such as the ffmpeg processes used for playback, grouped by a key
+    such as a guild ID. Each registered process is given a lower scheduling priority and an optional CPU time limit,
+    and can be killed once it has run for longer than a wall-clock limit or when its group is no longer needed.
+    """
+
+    def __init__(
+        self, niceness: int = 0, cpu_seconds: int = None, max_seconds: float = None
+    ):
+        self.niceness = niceness
+        self.cpu_seconds = cpu_seconds
+        self.max_seconds = max_seconds
+        self.processes: dict[int, SupervisedProcess] = {}
+        self.lock = Lock()
+
+    def register(self, key: int, process: subprocess.Popen):
+        """Start supervising a process, applying the niceness and CPU time limit to it.
+
+        Args:
+            key (int): The group that the process belongs to.
+            process (subprocess.Popen): The process to supervise.
+        """
+        try:
+            if self.niceness:
+                os.setpriority(os.PRIO_PROCESS, process.pid, self.niceness)
+            if self.cpu_seconds and resource and hasattr(resource, "prlimit"):
+                resource.prlimit(
+                    process.pid,
+                    resource.RLIMIT_CPU,
+                    (self.cpu_seconds, self.cpu_seconds + 5),
+                )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to limit process with pid {process.pid} - {e}")
+
+        with self.lock:
+            self.processes[process.pid] = SupervisedProcess(process, key, monotonic())
+
+    def reap(self) -> int:
+        """Stop tracking processes that have exited.
+
+        Returns:
+            int: The number of processes that had exited.
+        """
+        with self.lock:
+            exited = [
+                x for x, y in self.processes.items() if y.process.poll() is not None
+            ]
+            for pid in exited:
+                self.processes.pop(pid)
+        return len(exited)
+
+    def kill(self, key: int) -> int:
+        """Kill every running process in a group.
+
+        Args:
+            key (int): The group whose processes should be killed.
+
+        Returns:
+            int: The number of processes that were killed.
+        """
+        with self.lock:
+            supervised = [x for x in self.processes.values() if x.key == key]
+            for item in supervised:
+                self.processes.pop(item.process.pid, None)
+        return sum(self.terminate(x.process) for x in supervised)
+
+    def enforce(self) -> int:
+        """Kill every process that has run for longer than the wall-clock limit.
+
+        Returns:
+            int: The number of processes that were killed.
+        """
+        if not self.max_seconds:
+            return 0
+        deadline = monotonic() - self.max_seconds
+        with self.lock:
+            expired = [x for x in self.processes.values() if x.started < deadline]
+            for item in expired:
+                self.processes.pop(item.process.pid, None)
+        for item in expired:
+            logger.warning(
+                f"Killing process with pid {item.process.pid} after exceeding {self.max_seconds}s"
+            )
+        return sum(self.terminate(x.process) for x in expired)
+
+    def counts(self) -> dict[int, int]:
+        """Get the number of running processes in each group.
+
+        Returns:
+            dict[int, int]: The number of processes, keyed by group.
+        """
+        counts = {}
+        with self.lock:
+            for item in self.processes.values():
+                if item.process.poll() is None:
+                    counts[item.key] = counts.get(item.key, 0) + 1
+        return counts
+
+    @staticmethod
+    def terminate(process: subprocess.Popen) -> bool:
+        if process.poll() is not None:
+            return False
+        try:
+            process.kill()
+            process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        return True
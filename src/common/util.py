@@ -1,2 +1,82 @@
+from collections import deque
+from typing import Iterable, Iterator
+
+
 def r_replace(string: str, _old: str, _new: str, count: int = 1) -> str:
     return _new.join(string.rsplit(_old, count))
+
+
+class WordMatcher:
+    """Finds every occurrence of any of a set of words in a string in a single pass over the string, using an
+    Aho-Corasick automaton built from the words.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.build(words)
+
+    def build(self, words: Iterable[str]):
+        """Replace the words that are matched.
+
+        Args:
+            words (Iterable[str]): The words to match. Empty words are ignored.
+        """
+        transitions: list[dict[str, int]] = [{}]
+        outputs: list[str | None] = [None]
+        for word in words:
+            if not word:
+                continue
+            node = 0
+            for character in word:
+                next_node = transitions[node].get(character)
+                if next_node is None:
+                    next_node = len(transitions)
+                    transitions[node][character] = next_node
+                    transitions.append({})
+                    outputs.append(None)
+                node = next_node
+            outputs[node] = word
+
+        # The longest proper suffix of each node that is also in the automaton, and the longest such
+        # suffix that is a whole word, with 0 meaning there is none
+        fail = [0] * len(transitions)
+        links = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        while queue:
+            node = queue.popleft()
+            for character, child in transitions[node].items():
+                queue.append(child)
+                suffix = fail[node]
+                while suffix and character not in transitions[suffix]:
+                    suffix = fail[suffix]
+                suffix = transitions[suffix].get(character, 0)
+                fail[child] = suffix
+                links[child] = suffix if outputs[suffix] is not None else links[suffix]
+
+        self.transitions = transitions
+        self.outputs = outputs
+        self.fail = fail
+        self.links = links
+
+    def find(self, text: str) -> Iterator[tuple[int, str]]:
+        """Find every occurrence of the words in a string, including overlapping occurrences.
+
+        Args:
+            text (str): The string to search.
+
+        Yields:
+            tuple[int, str]: The index at which a word starts, and the word.
+        """
+        transitions = self.transitions
+        outputs = self.outputs
+        fail = self.fail
+        links = self.links
+        node = 0
+        for index, character in enumerate(text):
+            while node and character not in transitions[node]:
+                node = fail[node]
+            node = transitions[node].get(character, 0)
+            match = node if outputs[node] is not None else links[node]
+            while match:
+                word = outputs[match]
+                yield index - len(word) + 1, word
+                match = links[match]
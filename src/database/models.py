@@ -7,6 +7,7 @@ base = declarative_base()
 __all__ = [
     "VoiceAdminParent",
     "VoiceAdminChild",
+    "VoiceAdminPooled",
     "MusicChannels",
     "RedditMessagesEnabled",
     "InstagramMessagesEnabled",
@@ -37,6 +38,16 @@ class VoiceAdminChild(base):
     has_custom_name = Column(Boolean, nullable=False)
 
 
+class VoiceAdminPooled(base):
+    __tablename__ = "voiceadmin_pooled"
+    primary_key = Column(
+        BigInteger, primary_key=True, autoincrement=True, nullable=False
+    )
+    guild_id = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=False)
+    parent_id = Column(BigInteger, nullable=False)
+
+
 class MusicChannels(base):
     __tablename__ = "music_channels"
     guild_id = Column(BigInteger, primary_key=True, nullable=False)
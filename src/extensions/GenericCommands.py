@@ -63,6 +63,7 @@ def pretty_print_table(
     rows: (
         list[VoiceAdminParent]
         | list[VoiceAdminChild]
+        | list[VoiceAdminPooled]
         | list[MusicChannels]
         | list[RedditMessagesEnabled]
         | list[InstagramMessagesEnabled]
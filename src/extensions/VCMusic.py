@@ -1,26 +1,39 @@
+import asyncio
 import logging
+import math
 import os
 import re
+import shlex
+import sys
+import threading
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import IntEnum
 from random import shuffle
-from typing import Union
+from time import perf_counter, time
+from typing import AsyncIterator, Union
 from urllib.parse import parse_qs, urlparse
 
 import googleapiclient.discovery
+from googleapiclient.http import build_http
 from discord import (
+    AudioSource,
     ButtonStyle,
     Color,
     Embed,
+    FFmpegOpusAudio,
     FFmpegPCMAudio,
     Guild,
     Interaction,
     Member,
+    Message,
+    Object,
     PCMVolumeTransformer,
     PermissionOverwrite,
     TextChannel,
     TextStyle,
+    VoiceChannel,
     VoiceClient,
     VoiceState,
 )
@@ -34,14 +47,23 @@ from discord.app_commands import (
     guild_only,
     rename,
 )
+from discord.errors import NotFound
 from discord.ext import tasks
 from discord.ext.commands import Bot, GroupCog
 from discord.ui import Button, Modal, TextInput, View
-from youtubesearchpython import VideosSearch
+from youtubesearchpython.__future__ import VideosSearch
 from yt_dlp import YoutubeDL
 
-from common.discord import ColourTransformer, respond_or_followup
-from common.io import load_cog_toml
+from common.audio_workers import AudioWorkerPool, WorkerAudio
+from common.discord import (
+    ColourTransformer,
+    VoiceEvent,
+    VoiceEventClassifier,
+    respond_or_followup,
+)
+from common.metrics import MetricsRegistry, start_metrics_server
+from common.process import ProcessSupervisor
+from common.io import AudioCache, SnapshotStore, load_cog_toml, measure_loudness
 from database.gateway import DBSession
 from database.models import MusicChannels
 
@@ -51,15 +73,73 @@ AUTHOR_ID = 244050529271939073
 global MUSIC_AUTHOR
 MUSIC_AUTHOR = "fuxticks#1809"
 QUERY_RESULT_LIMIT = 15
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL = 3600
+SEARCH_KEYWORD_WEIGHTS = (
+    ("official", 2),
+    ("music", 1),
+    ("audio", 1.5),
+    ("lyric", 1),
+    ("live", -1.5),
+    ("cover", -2),
+    ("reaction", -4),
+)
+STREAM_EXPIRY_MARGIN = 300
+METADATA_CACHE_SIZE = int(os.getenv("MUSIC_METADATA_CACHE_SIZE", 1000))
+RESOLVE_WORKERS = int(os.getenv("MUSIC_RESOLVE_WORKERS", 4))
+MAX_QUEUE_LENGTH = int(os.getenv("MUSIC_MAX_QUEUE_LENGTH", 1000))
 INACTIVE_TIMEOUT = 60
+EMBED_UPDATE_DELAY = 1.0
+PLAYBACK_WATCHDOG_INTERVAL = 30
+QUEUE_PAGE_SIZE = 15
 EMBED_IMAGE_URL = os.getenv("MUSIC_DEFAULT_IMAGE")
 MUSIC_INTERACTION_PREFIX = f"{__name__}.interaction"
 INTERACTION_SPLIT_CHARACTER = "."
 FFMPEG_PLAYER_OPTIONS = "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
+PRELOAD_SECONDS = float(os.getenv("MUSIC_PRELOAD_SECONDS", 10))
+CROSSFADE_SECONDS = float(os.getenv("MUSIC_CROSSFADE_SECONDS", 0))
+TARGET_LOUDNESS = (
+    float(os.getenv("MUSIC_TARGET_LOUDNESS"))
+    if os.getenv("MUSIC_TARGET_LOUDNESS")
+    else None
+)
+MAX_LOUDNESS_GAIN = 10
+LOUDNESS_WORKERS = 1
+LOUDNESS_RETRY_SECONDS = 600
+MAX_LOUDNESS_RETRY_SECONDS = 86400
+OPUS_PASSTHROUGH = os.getenv("MUSIC_OPUS_PASSTHROUGH", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API")
 YOUTUBE_API = googleapiclient.discovery.build(
     "youtube", "v3", developerKey=GOOGLE_API_KEY
 )
+AUDIO_CACHE_DIR = os.getenv("MUSIC_CACHE_DIR")
+AUDIO_CACHE = (
+    AudioCache(
+        AUDIO_CACHE_DIR,
+        max_bytes=int(os.getenv("MUSIC_CACHE_MAX_MB", 2048)) * 1_000_000,
+        min_plays=int(os.getenv("MUSIC_CACHE_MIN_PLAYS", 3)),
+    )
+    if AUDIO_CACHE_DIR
+    else None
+)
+METRICS_PORT = int(os.getenv("MUSIC_METRICS_PORT") or 0)
+METRICS_HOST = os.getenv("MUSIC_METRICS_HOST", "127.0.0.1")
+MUSIC_METRICS = MetricsRegistry("vcmusic")
+FFMPEG_SUPERVISOR = ProcessSupervisor(
+    niceness=int(os.getenv("MUSIC_FFMPEG_NICENESS", 5)),
+    cpu_seconds=int(os.getenv("MUSIC_FFMPEG_CPU_SECONDS") or 0) or None,
+    max_seconds=float(os.getenv("MUSIC_FFMPEG_MAX_SECONDS") or 4 * 3600),
+)
+PROCESS_CHECK_INTERVAL = 30
+AUDIO_WORKERS = int(os.getenv("MUSIC_AUDIO_WORKERS") or 0)
+AUDIO_WORKER_POOL = AudioWorkerPool(AUDIO_WORKERS) if AUDIO_WORKERS else None
+STATE_DIR = os.getenv("MUSIC_STATE_DIR")
+SNAPSHOT_INTERVAL = int(os.getenv("MUSIC_SNAPSHOT_INTERVAL", 30))
+QUEUE_SNAPSHOTS = SnapshotStore(STATE_DIR) if STATE_DIR else None
 
 
 class UserActionType(IntEnum):
@@ -78,6 +158,10 @@ class UserActionType(IntEnum):
     VOLUME_MODAL_SUBMIT = 12
     VOLUME_MODAL_VALUE = 13
     SHUFFLE = 14
+    EDIT_QUEUE_MODAL_POSITION = 15
+    EDIT_QUEUE_MODAL_NEW_POSITION = 16
+    QUEUE_PREVIOUS_PAGE = 17
+    QUEUE_NEXT_PAGE = 18
 
     @property
     def id(self) -> str:
@@ -113,6 +197,14 @@ class UserActionType(IntEnum):
                 return f"{base}volumemodalvalue"
             case UserActionType.SHUFFLE:
                 return f"{base}shuffle"
+            case UserActionType.EDIT_QUEUE_MODAL_POSITION:
+                return f"{base}editmodalposition"
+            case UserActionType.EDIT_QUEUE_MODAL_NEW_POSITION:
+                return f"{base}editmodalnewposition"
+            case UserActionType.QUEUE_PREVIOUS_PAGE:
+                return f"{base}queuepreviouspage"
+            case UserActionType.QUEUE_NEXT_PAGE:
+                return f"{base}queuenextpage"
             case _:
                 raise ValueError("Invalid enum type given!")
 
@@ -154,6 +246,14 @@ class UserActionType(IntEnum):
                 return UserActionType.VOLUME_MODAL_VALUE
             case "shuffle":
                 return UserActionType.SHUFFLE
+            case "editmodalposition":
+                return UserActionType.EDIT_QUEUE_MODAL_POSITION
+            case "editmodalnewposition":
+                return UserActionType.EDIT_QUEUE_MODAL_NEW_POSITION
+            case "queuepreviouspage":
+                return UserActionType.QUEUE_PREVIOUS_PAGE
+            case "queuenextpage":
+                return UserActionType.QUEUE_NEXT_PAGE
             case _:
                 raise ValueError(f"Invalid string given for {__class__.__name__}")
 
@@ -169,6 +269,46 @@ class SongRequestType(IntEnum):
     YOUTUBE_THUMBNAIL = 4
 
 
+@dataclass(slots=True)
+class StreamRecord:
+    """The minimal data needed to stream a song, taken from the much larger info dictionary given by yt-dlp."""
+
+    url: str
+    expires_at: float = None
+    codec: str = None
+    bitrate: int = None
+    duration: float = None
+    headers: dict = None
+
+    @classmethod
+    def from_info(cls, info: dict) -> "StreamRecord":
+        """Create a StreamRecord from the info dictionary of a yt-dlp extract_info call.
+
+        Args:
+            info (dict): The info of the video.
+
+        Returns:
+            StreamRecord: The data needed to stream the video.
+        """
+        url = info.get("url")
+        expiry = parse_qs(urlparse(url).query).get("expire", [None])[0]
+        return cls(
+            url=url,
+            expires_at=float(expiry) if expiry and expiry.isdigit() else None,
+            codec=info.get("acodec"),
+            bitrate=round(info.get("abr") or 0) or None,
+            duration=info.get("duration"),
+            headers=info.get("http_headers") or None,
+        )
+
+    @property
+    def is_expired(self) -> bool:
+        """If the stream URL has expired, or will expire within STREAM_EXPIRY_MARGIN seconds."""
+        if self.expires_at is None:
+            return False
+        return time() + STREAM_EXPIRY_MARGIN >= self.expires_at
+
+
 @dataclass(slots=True)
 class SongRequest:
     """Represents all the information known about a song request. This can represent a song with only it's request data,
@@ -181,50 +321,50 @@ class SongRequest:
     url: str = None
     title: str = None
     thumbnail: str = None
-    stream_data: dict = None
+    stream_data: StreamRecord = None
 
-    async def get_song(self) -> Union[list["SongRequest"], "SongRequest", None]:
+    async def get_song(
+        self,
+    ) -> Union[AsyncIterator[list["SongRequest"]], "SongRequest", None]:
         """For STRING requests, fetches basic metadata such as title and URL. For YOUTUBE_VIDEO requests, fetches all streaming
-        data. For YOUTUBE_PLAYLIST requests, finds all the videos in the playlist and returns basic metadata such as title and
-        URL for each video as a list.
+        data. For YOUTUBE_PLAYLIST requests, gives an iterator that finds the videos in the playlist a page at a time and
+        returns basic metadata such as title and URL for each video as a list.
 
         Raises:
         ValueError: If an unknown SongRequestType is given, the song data cannot be gathered and raises a ValueError.
 
         Returns:
-            Union[list[SongRequest], SongRequest, None]: If the request given is a playlist, get_song will return each song in
-            the playlist as it's own SongRequest. If the GOOGLE_API environment variable is missing None is returned. For
-            STRING and YOUTUBE_VIDEO requests, and SongRequest with it's metadata filled in will be returned.
+            Union[AsyncIterator[list[SongRequest]], SongRequest, None]: If the request given is a playlist, get_song will
+            return an iterator of pages of the playlist, with each song as it's own SongRequest. If the GOOGLE_API
+            environment variable is missing None is returned. For STRING and YOUTUBE_VIDEO requests, and SongRequest with
+            it's metadata filled in will be returned.
         """
         match self.request_type:
             case SongRequestType.STRING:
-                result = string_request_query(self)
+                result = await string_request_query(self)
                 parsed_result = parse_string_query_result(result)
                 self.url = parsed_result.get("url")
                 self.title = parsed_result.get("title")
                 self.thumbnail = parsed_result.get("thumbnail")
                 return self
             case SongRequestType.YOUTUBE_VIDEO:
-                result = self.get_stream_data()
+                await asyncio.to_thread(self.get_stream_data)
                 return self
             case SongRequestType.YOUTUBE_PLAYLIST:
                 if not GOOGLE_API_KEY:
                     return None
-                playlist_items = get_playlist_items(self.raw_request)
-                song_requests = parse_playlist_response(
-                    self.raw_request, self.request_member, playlist_items
-                )
-                return song_requests
+                return iter_playlist_songs(self.raw_request, self.request_member)
             case _:
                 raise ValueError("Invalid SongRequestType given!")
 
-    def get_stream_data(self) -> dict:
-        """Gets the data required to stream a given SongRequest to a Discord VoiceClient.
+    def get_stream_data(self) -> StreamRecord:
+        """Gets the data required to stream a given SongRequest to a Discord VoiceClient. If the
+        existing stream data has expired, it is fetched again.
 
         Returns:
-            dict: A dictionary containing all the data, and more, needed to stream to a Discord VoiceClient.
+            StreamRecord: The data needed to stream to a Discord VoiceClient.
         """
-        if self.stream_data is not None:
+        if self.stream_data is not None and not self.stream_data.is_expired:
             return self.stream_data
 
         ydl_opts = {
@@ -254,15 +394,345 @@ class SongRequest:
             ):
                 self.url = self.url.split("&list")[0]
             info = ydl.extract_info(self.url, download=False)
-            self.stream_data = info
+            self.stream_data = StreamRecord.from_info(info)
 
         if self.title is None:
-            self.title = escape_discord_characters(self.stream_data.get("title"))
+            self.title = escape_discord_characters(info.get("title"))
 
         if self.thumbnail is None:
-            self.thumbnail = self.stream_data.get("thumbnail")
+            self.thumbnail = info.get("thumbnail")
 
-        return info
+        return self.stream_data
+
+
+@dataclass(slots=True)
+class TrackMetadata:
+    """The metadata of a video that is known without needing to keep a SongRequest for it."""
+
+    title: str = None
+    thumbnail: str = None
+    stream_data: StreamRecord = None
+    loudness: float = None
+    loudness_failures: int = 0
+    loudness_retry_at: float = 0
+
+
+class TrackMetadataCache:
+    """A size limited, least recently used cache of TrackMetadata keyed by video ID. Queued songs only store
+    their video ID, so the metadata of a song is looked up here, and fetched again if it has been evicted.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, TrackMetadata] = OrderedDict()
+
+    def get(self, video_id: str) -> Union[TrackMetadata, None]:
+        metadata = self.entries.get(video_id)
+        if metadata is not None:
+            self.entries.move_to_end(video_id)
+        return metadata
+
+    def update(
+        self,
+        video_id: str,
+        title: str = None,
+        thumbnail: str = None,
+        stream_data: StreamRecord = None,
+        loudness: float = None,
+    ):
+        """Update the metadata of a given video with the values given, keeping any existing values
+        that are not given.
+
+        Args:
+            video_id (str): The ID of the video.
+            title (str, optional): The title of the video. Defaults to None.
+            thumbnail (str, optional): The thumbnail URL of the video. Defaults to None.
+            stream_data (StreamRecord, optional): The data needed to stream the video. Defaults to None.
+            loudness (float, optional): The integrated loudness of the video in LUFS. Defaults to None.
+        """
+        metadata = self.entries.get(video_id)
+        if metadata is None:
+            if (
+                title is None
+                and thumbnail is None
+                and stream_data is None
+                and loudness is None
+            ):
+                return
+            metadata = TrackMetadata()
+            self.entries[video_id] = metadata
+        else:
+            self.entries.move_to_end(video_id)
+
+        metadata.title = title or metadata.title
+        metadata.thumbnail = thumbnail or metadata.thumbnail
+        metadata.stream_data = stream_data or metadata.stream_data
+        if loudness is not None:
+            metadata.loudness = loudness
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+TRACK_METADATA = TrackMetadataCache(METADATA_CACHE_SIZE)
+
+
+def get_track_gain(video_id: str) -> float:
+    """Get the gain needed to bring a song to TARGET_LOUDNESS, based on its measured loudness.
+
+    Args:
+        video_id (str): The video ID of the song.
+
+    Returns:
+        float: The gain in dB, or 0 if loudness normalisation is disabled or the song has not been measured.
+    """
+    if TARGET_LOUDNESS is None:
+        return 0
+    metadata = TRACK_METADATA.get(video_id)
+    if metadata is None or metadata.loudness is None:
+        return 0
+    gain = TARGET_LOUDNESS - metadata.loudness
+    return round(min(max(gain, -MAX_LOUDNESS_GAIN), MAX_LOUDNESS_GAIN), 2)
+
+
+class SongQueue:
+    """A compact queue of songs. Each song is stored only as its video ID and the ID of the member that requested it,
+    with any other metadata being kept in TRACK_METADATA. The IDs are stored next to each other in a single list,
+    along with the position of the first song still in the queue, so that songs can be taken from the front of the
+    queue without shifting the rest of the list each time. The version is incremented whenever the queue changes.
+    """
+
+    __slots__ = ("items", "head", "version")
+
+    # Songs taken from the front of the queue are only removed from the list once there are at least this many,
+    # and they make up at least half of the list.
+    COMPACT_THRESHOLD = 256
+
+    def __init__(self):
+        self.items: list[str | int] = []
+        self.head = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return (len(self.items) >> 1) - self.head
+
+    def extend(self, songs: list["SongRequest"]):
+        """Add the given songs to the end of the queue, storing any known metadata in TRACK_METADATA.
+
+        Args:
+            songs (list[SongRequest]): The songs to add to the queue.
+        """
+        for song in songs:
+            video_id = get_video_id(song.url or song.raw_request)
+            if video_id is None:
+                video_id = song.url or song.raw_request
+            TRACK_METADATA.update(
+                video_id,
+                title=song.title,
+                thumbnail=song.thumbnail,
+                stream_data=song.stream_data,
+            )
+            self.items += (sys.intern(video_id), song.request_member.id)
+        self.version += 1
+
+    def extend_entries(self, video_ids: list[str], requester_ids: list[int]):
+        """Add songs to the end of the queue using only their IDs, such as when restoring a saved queue.
+
+        Args:
+            video_ids (list[str]): The video ID of each song.
+            requester_ids (list[int]): The ID of the member that requested each song.
+        """
+        for video_id, requester_id in zip(video_ids, requester_ids):
+            self.items += (sys.intern(video_id), requester_id)
+        self.version += 1
+
+    def ids(self) -> tuple[list[str], list[int]]:
+        """Get the IDs of every song in the queue.
+
+        Returns:
+            tuple[list[str], list[int]]: The video ID of each song, and the ID of the member that requested each song.
+        """
+        start = self.head * 2
+        return self.items[start::2], self.items[start + 1 :: 2]
+
+    def position(self, index: int) -> int:
+        """Get the index in the list of the video ID of the song at a given position in the queue.
+
+        Args:
+            index (int): The position of the song in the queue.
+
+        Raises:
+            IndexError: If there is no song at the given position.
+
+        Returns:
+            int: The index of the song's video ID in items, which is followed by the ID of the requesting member.
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("SongQueue index out of range")
+        return (self.head + index) * 2
+
+    def pop(self) -> tuple[str, int]:
+        """Remove and return the song at the front of the queue.
+
+        Raises:
+            IndexError: If the queue is empty.
+
+        Returns:
+            tuple[str, int]: The video ID of the song and the ID of the member that requested it.
+        """
+        items = self.items
+        start = self.head * 2
+        if start >= len(items):
+            raise IndexError("pop from an empty SongQueue")
+        song = items[start], items[start + 1]
+        self.head += 1
+        if self.head >= self.COMPACT_THRESHOLD and start >= len(items) >> 1:
+            del items[: start + 2]
+            self.head = 0
+        self.version += 1
+        return song
+
+    def remove(self, index: int) -> tuple[str, int]:
+        """Remove and return the song at a given position in the queue.
+
+        Args:
+            index (int): The position of the song to remove.
+
+        Raises:
+            IndexError: If there is no song at the given position.
+
+        Returns:
+            tuple[str, int]: The video ID of the song and the ID of the member that requested it.
+        """
+        start = self.position(index)
+        video_id, requester_id = self.items[start : start + 2]
+        del self.items[start : start + 2]
+        self.version += 1
+        return video_id, requester_id
+
+    def move(self, index: int, new_index: int):
+        """Move the song at a given position in the queue to a new position.
+
+        Args:
+            index (int): The current position of the song.
+            new_index (int): The position to move the song to.
+
+        Raises:
+            IndexError: If there is no song at the given position.
+        """
+        items = self.items
+        start = self.position(index)
+        song = items[start : start + 2]
+        del items[start : start + 2]
+        start = (self.head + min(max(new_index, 0), len(self))) * 2
+        items[start:start] = song
+        self.version += 1
+
+    def entries(self, start: int = 0, stop: int = None) -> list[tuple[str, int]]:
+        """Get the songs in a given range of the queue.
+
+        Args:
+            start (int, optional): The index of the first song. Defaults to 0.
+            stop (int, optional): The index after the last song. Defaults to the end of the queue.
+
+        Returns:
+            list[tuple[str, int]]: The video ID and requesting member ID of each song in the range.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        items = self.items[(self.head + start) * 2 : (self.head + stop) * 2]
+        return list(zip(items[::2], items[1::2]))
+
+    def shuffle(self):
+        entries = self.entries()
+        shuffle(entries)
+        self.items = [x for entry in entries for x in entry]
+        self.head = 0
+        self.version += 1
+
+    def clear(self):
+        self.items.clear()
+        self.head = 0
+        self.version += 1
+
+
+def song_from_entry(video_id: str, requester_id: int, guild: Guild) -> SongRequest:
+    """Create a SongRequest for a song in a SongQueue using the metadata in TRACK_METADATA.
+
+    Args:
+        video_id (str): The video ID of the song.
+        requester_id (int): The ID of the member that requested the song.
+        guild (Guild): The guild in which the song was requested.
+
+    Returns:
+        SongRequest: The song as a YOUTUBE_VIDEO SongRequest.
+    """
+    url = video_id if "/" in video_id else f"https://www.youtube.com/watch?v={video_id}"
+    member = guild.get_member(requester_id) if isinstance(guild, Guild) else None
+    metadata = TRACK_METADATA.get(video_id) or TrackMetadata()
+    stream_data = metadata.stream_data
+    if stream_data is not None and stream_data.is_expired:
+        stream_data = metadata.stream_data = None
+    return SongRequest(
+        raw_request=url,
+        request_type=SongRequestType.YOUTUBE_VIDEO,
+        request_member=member or Object(id=requester_id),
+        url=url,
+        title=metadata.title,
+        thumbnail=metadata.thumbnail,
+        stream_data=stream_data,
+    )
+
+
+def get_entry_title(video_id: str) -> str:
+    """Get the title to display for a song in a SongQueue.
+
+    Args:
+        video_id (str): The video ID of the song.
+
+    Returns:
+        str: The title of the song if known, otherwise the URL of the song.
+    """
+    metadata = TRACK_METADATA.get(video_id)
+    if metadata and metadata.title:
+        return metadata.title
+    return video_id if "/" in video_id else f"https://youtu.be/{video_id}"
+
+
+async def fetch_track_metadata(video_ids: list[str]):
+    """Ensure that the titles and thumbnails of the given videos are in TRACK_METADATA, fetching
+    any that are missing from the YouTube API.
+
+    Args:
+        video_ids (list[str]): The IDs of the videos to fetch the metadata of.
+    """
+    missing = [
+        x
+        for x in dict.fromkeys(video_ids)
+        if "/" not in x and (TRACK_METADATA.get(x) or TrackMetadata()).title is None
+    ]
+    if not missing or not GOOGLE_API_KEY:
+        return
+
+    def execute(ids: list[str]) -> dict:
+        request = YOUTUBE_API.videos().list(
+            part="snippet", id=",".join(ids), maxResults=50
+        )
+        return request.execute(http=build_http())
+
+    for idx in range(0, len(missing), 50):
+        try:
+            response = await asyncio.to_thread(execute, missing[idx : idx + 50])
+        except Exception as error:
+            logging.getLogger(__name__).warning(
+                f"Unable to fetch metadata for queued songs - {error}"
+            )
+            return
+        for item in response.get("items", []):
+            title, _, thumbnail = parse_playlist_item(item)
+            TRACK_METADATA.update(item.get("id"), title=title, thumbnail=thumbnail)
 
 
 @dataclass(slots=True)
@@ -273,9 +743,11 @@ class GuildMusicPlayer:
 
     guild: Union[Guild, int]
     current_song: Union[None, SongRequest] = None
-    queue: list = field(default_factory=list)
+    queue: SongQueue = field(default_factory=SongQueue)
     voice_client: Union[None, VoiceClient] = None
     volume: int = 100
+    generation: int = 0
+    resume_position: float = 0
 
     def __eq__(self, other: "GuildMusicPlayer") -> bool:
         if not isinstance(other, GuildMusicPlayer):
@@ -285,6 +757,273 @@ class GuildMusicPlayer:
         return value1 == value2
 
 
+class MusicAudioSource(AudioSource):
+    """The audio source used for playback of a song. Wraps either an ffmpeg PCM source with a volume transformer or,
+    when OPUS_PASSTHROUGH is enabled, an ffmpeg Opus source with the volume applied as an ffmpeg filter so that no
+    audio is decoded or encoded in Python. Also keeps track of how much of the song has been played, so that the
+    source can be recreated at the same position when the volume of an Opus source changes.
+
+    When a PCM source is given the source of the next song and its duration is known, the last CROSSFADE_SECONDS of
+    the song are mixed with the start of the next song. Any loudness normalisation gain is applied by ffmpeg.
+
+    When MUSIC_AUDIO_WORKERS is set, PCM sources are instead decoded, scaled and encoded in a worker process, and
+    the encoded Opus frames are read from the worker.
+    """
+
+    FRAME_LENGTH = 0.02
+
+    def __init__(
+        self,
+        source: str,
+        volume: int = 100,
+        is_stream: bool = True,
+        codec: str = None,
+        bitrate: int = None,
+        start_offset: float = 0,
+        headers: dict = None,
+        duration: float = None,
+        gain: float = 0,
+        guild_id: int = None,
+    ):
+        self.source = source
+        self.volume = volume
+        self.is_stream = is_stream
+        self.codec = codec
+        self.bitrate = bitrate
+        self.start_offset = start_offset
+        self.headers = headers
+        self.duration = duration
+        self.gain = gain
+        self.guild_id = guild_id
+        self.play_started: Union[float, None] = None
+        self.frames_read = 0
+        self.next_source: Union[MusicAudioSource, None] = None
+        self.handover_lock = threading.Lock()
+
+        before_options = FFMPEG_PLAYER_OPTIONS if is_stream else ""
+        if headers:
+            header_lines = "".join(
+                f"{key}: {value}\r\n" for key, value in headers.items()
+            )
+            before_options = f"{before_options} -headers {shlex.quote(header_lines)}"
+        if start_offset:
+            before_options = f"{before_options} -ss {start_offset:.2f}"
+
+        if OPUS_PASSTHROUGH:
+            options = "-vn"
+            scale = float(volume) / float(100) * 10 ** (gain / 20)
+            if scale != 1:
+                options += f" -filter:a volume={scale:.4f}"
+            ffmpeg_audio = FFmpegOpusAudio(
+                source,
+                codec=codec if scale == 1 else None,
+                bitrate=min(bitrate or 128, 512),
+                before_options=before_options,
+                options=options,
+            )
+            self.audio = ffmpeg_audio
+        elif AUDIO_WORKER_POOL:
+            options = "-vn"
+            if gain:
+                options += f" -filter:a volume={gain}dB"
+            ffmpeg_audio = None
+            self.audio = AUDIO_WORKER_POOL.open(
+                source, before_options, options, float(volume) / float(100)
+            )
+        else:
+            options = "-vn"
+            if gain:
+                options += f" -filter:a volume={gain}dB"
+            ffmpeg_audio = FFmpegPCMAudio(
+                source, before_options=before_options, options=options
+            )
+            self.audio = PCMVolumeTransformer(
+                ffmpeg_audio, volume=float(volume) / float(100)
+            )
+
+        # discord.py does not expose the ffmpeg process, so it is taken from the audio source directly.
+        process = getattr(ffmpeg_audio, "_process", None)
+        if process:
+            FFMPEG_SUPERVISOR.register(guild_id or 0, process)
+
+    @property
+    def position(self) -> float:
+        """The position in seconds of the song that has been played so far."""
+        return self.start_offset + self.frames_read * self.FRAME_LENGTH
+
+    def read(self) -> bytes:
+        data = self.audio.read()
+        if not data:
+            return data
+        if self.play_started is not None:
+            MUSIC_METRICS.observe(
+                "time_to_audio_seconds",
+                perf_counter() - self.play_started,
+                self.guild_id,
+            )
+            self.play_started = None
+        self.frames_read += 1
+
+        if self.next_source is None or not self.duration:
+            return data
+
+        remaining = self.duration - self.position
+        if remaining > CROSSFADE_SECONDS:
+            return data
+
+        # The next source is handed over to its own player under the lock, so it is never read by both players.
+        with self.handover_lock:
+            next_source = self.next_source
+            upcoming = next_source.read() if next_source else None
+        if not upcoming:
+            return data
+        return mix_pcm_frames(data, upcoming, 1 - max(remaining, 0) / CROSSFADE_SECONDS)
+
+    def is_opus(self) -> bool:
+        return self.audio.is_opus()
+
+    def set_next_source(self, source: Union["MusicAudioSource", None]):
+        """Set the source to crossfade into, waiting for any frame that is being mixed from the current
+        next source to finish.
+
+        Args:
+            source (Union[MusicAudioSource, None]): The source of the next song, or None to stop crossfading.
+        """
+        with self.handover_lock:
+            self.next_source = source
+
+    def cleanup(self):
+        # The audio is missing if ffmpeg failed to start
+        audio = getattr(self, "audio", None)
+        if audio is not None:
+            audio.cleanup()
+
+    def with_volume(self, volume: int) -> "MusicAudioSource":
+        """Get a source that has the given volume applied. For PCM and audio worker sources the volume
+        is changed in place, for Opus sources a new source is created at the current position.
+
+        Args:
+            volume (int): The volume percentage between 0 and 100.
+
+        Returns:
+            MusicAudioSource: The source with the volume applied.
+        """
+        if isinstance(self.audio, (PCMVolumeTransformer, WorkerAudio)):
+            self.audio.volume = float(volume) / float(100)
+            self.volume = volume
+            return self
+
+        return MusicAudioSource(
+            self.source,
+            volume=volume,
+            is_stream=self.is_stream,
+            codec=self.codec,
+            bitrate=self.bitrate,
+            start_offset=self.position,
+            headers=self.headers,
+            duration=self.duration,
+            gain=self.gain,
+            guild_id=self.guild_id,
+        )
+
+
+def mix_pcm_frames(current: bytes, upcoming: bytes, weight: float) -> bytes:
+    """Mix two frames of 16-bit PCM audio, fading from the current frame to the upcoming frame.
+
+    Args:
+        current (bytes): The frame of the song that is ending.
+        upcoming (bytes): The frame of the song that is starting.
+        weight (float): How much of the upcoming frame to use, between 0 and 1.
+
+    Returns:
+        bytes: The mixed frame.
+    """
+    current_samples = array("h", current)
+    upcoming_samples = array("h", upcoming)
+    if len(upcoming_samples) < len(current_samples):
+        upcoming_samples.extend([0] * (len(current_samples) - len(upcoming_samples)))
+    return array(
+        "h",
+        [int(x + (y - x) * weight) for x, y in zip(current_samples, upcoming_samples)],
+    ).tobytes()
+
+
+@dataclass(slots=True)
+class PreloadedSong:
+    """The source of the next song in a guild's queue, created before the current song ends."""
+
+    video_id: str
+    song: SongRequest
+    source: MusicAudioSource
+    stream_data: Union[StreamRecord, None] = None
+    mixed_into: Union[MusicAudioSource, None] = None
+
+    def release(self):
+        """Stop the source of the current song from crossfading into this song."""
+        if self.mixed_into is not None:
+            self.mixed_into.set_next_source(None)
+            self.mixed_into = None
+
+
+def create_song_source(
+    video_id: str,
+    song: SongRequest,
+    volume: int,
+    start_offset: float = 0,
+    gain: float = 0,
+    guild_id: int = None,
+) -> tuple[MusicAudioSource, Union[StreamRecord, None]]:
+    """Create the audio source for a song, using the audio cache if the song is cached. This is blocking, as
+    the stream of the song may need to be fetched and ffmpeg is started, so should be run off the event loop
+    when possible.
+
+    Args:
+        video_id (str): The video ID of the song.
+        song (SongRequest): The song to create the source of.
+        volume (int): The volume percentage between 0 and 100.
+        start_offset (float, optional): The position in seconds to start the song from. Defaults to 0.
+        gain (float, optional): The loudness normalisation gain in dB to apply. Defaults to 0.
+        guild_id (int, optional): The ID of the guild the song is for, used to label metrics. Defaults to None.
+
+    Returns:
+        tuple[MusicAudioSource, Union[StreamRecord, None]]: The source of the song, and the stream data of the song
+        if it was not played from the audio cache.
+    """
+    is_video_id = "/" not in video_id
+    cached_file = AUDIO_CACHE.get(video_id) if AUDIO_CACHE and is_video_id else None
+
+    if cached_file and song.title is not None:
+        duration = song.stream_data.duration if song.stream_data else None
+        source = MusicAudioSource(
+            cached_file,
+            volume=volume,
+            is_stream=False,
+            codec="opus",
+            start_offset=start_offset,
+            duration=duration,
+            gain=gain,
+            guild_id=guild_id,
+        )
+        MUSIC_METRICS.increment("audio_cache_plays", guild_id)
+        return source, None
+
+    started = perf_counter()
+    stream_data = song.get_stream_data()
+    MUSIC_METRICS.observe("stream_resolve_seconds", perf_counter() - started, guild_id)
+    source = MusicAudioSource(
+        stream_data.url,
+        volume=volume,
+        codec=stream_data.codec,
+        bitrate=stream_data.bitrate,
+        start_offset=start_offset,
+        headers=stream_data.headers,
+        duration=stream_data.duration,
+        gain=gain,
+        guild_id=guild_id,
+    )
+    return source, stream_data
+
+
 def parse_request_type(request: str) -> SongRequestType:
     """Get the kind of request a given string is.
 
@@ -314,6 +1053,29 @@ def parse_request_type(request: str) -> SongRequestType:
     return SongRequestType.STRING
 
 
+def get_video_id(url: str) -> Union[str, None]:
+    """Get the YouTube video ID from a given video URL.
+
+    Args:
+        url (str): The URL of the video.
+
+    Returns:
+        Union[str, None]: The ID of the video, or None if the URL is not a YouTube video URL.
+    """
+    if not url or parse_request_type(url) != SongRequestType.YOUTUBE_VIDEO:
+        return None
+
+    if not url.startswith("http"):
+        url = f"https://{url}"
+
+    parsed_url = urlparse(url)
+    if parsed_url.netloc.endswith("youtu.be"):
+        return parsed_url.path.strip("/").split("/")[0] or None
+
+    query = parse_qs(parsed_url.query)
+    return query.get("v", [None])[0]
+
+
 def convert_viewcount_to_float(short_views: str) -> float:
     """Convert the short string for views of a YouTube video to a float value.
 
@@ -342,13 +1104,133 @@ def convert_viewcount_to_float(short_views: str) -> float:
     return float(raw[:-1]) * (10**power)
 
 
-def string_request_query(request: SongRequest) -> dict:
+class SearchResultCache:
+    """A size limited, least recently used cache of YouTube search results keyed by normalised query. Each entry
+    holds the task performing the search, so that identical searches made at the same time share one request.
+    Entries expire after a given number of seconds, so that new uploads eventually appear in the results.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries: OrderedDict[str, tuple[float, asyncio.Task]] = OrderedDict()
+
+    async def search(self, query: str) -> list[dict]:
+        """Get the results of a YouTube video search, using the cached results if there are any.
+
+        Args:
+            query (str): The query to search for.
+
+        Returns:
+            list[dict]: The video results of the search.
+        """
+        key = " ".join(query.lower().split())
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] > time():
+            self.entries.move_to_end(key)
+            task = entry[1]
+            MUSIC_METRICS.increment("search_cache_hits")
+        else:
+            MUSIC_METRICS.increment("search_cache_misses")
+            task = asyncio.ensure_future(self.fetch(query))
+            self.entries[key] = (time() + self.ttl, task)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self.entries.get(key, (None, None))[1] is task:
+                self.entries.pop(key)
+            raise
+
+    async def fetch(self, query: str) -> list[dict]:
+        result = await VideosSearch(query, limit=QUERY_RESULT_LIMIT).next()
+        return result.get("result") or []
+
+
+SEARCH_RESULTS = SearchResultCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+
+
+def parse_duration(duration: Union[str, None]) -> Union[int, None]:
+    """Convert the duration of a YouTube video given as `h:mm:ss` or `m:ss` to a number of seconds.
+
+    Args:
+        duration (Union[str, None]): The duration string.
+
+    Returns:
+        Union[int, None]: The duration in seconds, or None if it could not be parsed.
+    """
+    if not duration:
+        return None
+    seconds = 0
+    for part in duration.split(":"):
+        if not part.isdigit():
+            return None
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def rank_query_results(query: str, results: list[dict]) -> list[dict]:
+    """Order the results of a search so that the most likely music video for the query comes first. Each result
+    is scored on how many of the query's words and weighted keywords are in its title, how many views it has, and
+    whether its duration is typical of a song. YouTube's own ordering is used to break ties.
+
+    Args:
+        query (str): The query that was searched.
+        results (list[dict]): The results of the search.
+
+    Returns:
+        list[dict]: The results, from the best to the worst match.
+    """
+    query_words = set(re.findall(r"\w+", query.lower()))
+    scores = []
+    for position, result in enumerate(results):
+        title = (result.get("title") or "").lower()
+        title_words = set(re.findall(r"\w+", title))
+
+        keyword_score = sum(
+            weight for keyword, weight in SEARCH_KEYWORD_WEIGHTS if keyword in title
+        )
+        match_score = (
+            4 * len(query_words & title_words) / len(query_words) if query_words else 0
+        )
+
+        views = convert_viewcount_to_float(
+            (result.get("viewCount") or {}).get("short") or "0"
+        )
+        view_score = math.log10(views + 1) / 2
+
+        duration = parse_duration(result.get("duration"))
+        if duration is None:
+            # Live streams and premieres have no duration
+            duration_score = -3
+        elif 90 <= duration <= 600:
+            duration_score = 1
+        elif duration <= 30 or duration >= 1200:
+            duration_score = -2
+        else:
+            duration_score = 0
+
+        score = (
+            keyword_score + match_score + view_score + duration_score - position * 0.1
+        )
+        scores.append(score)
+
+    order = sorted(range(len(results)), key=lambda x: scores[x], reverse=True)
+    return [results[x] for x in order]
+
+
+async def string_request_query(request: SongRequest) -> dict:
     """Find YouTube videos that fit the given song request. The algorithm is weighted to try and find
     "music" videos as the general purpose of the bot is for music.
 
     Args:
         request (SongRequest): The song request to query.
 
+    Raises:
+        ValueError: If no videos were found for the request.
+
     Returns:
         dict: All the metadata about the found video result.
     """
@@ -357,24 +1239,14 @@ def string_request_query(request: SongRequest) -> dict:
     else:
         query = request.raw_request
 
-    video_results = VideosSearch(query, limit=QUERY_RESULT_LIMIT).resultComponents
-    if request.request_type != SongRequestType.STRING and video_results:
-        return video_results[0]
-
-    preferred_keywords = ["official", "music"]
-    alternate_keywords = ["lyric", "audio"]
+    video_results = await SEARCH_RESULTS.search(query)
+    if not video_results:
+        raise ValueError(f"No videos found for {request.raw_request}")
 
-    for result in video_results:
-        video_title = result.get("title").lower()
-        for keyword in preferred_keywords:
-            if keyword in video_title:
-                return result
-
-        for keyword in alternate_keywords:
-            if keyword in video_title:
-                return result
+    if request.request_type != SongRequestType.STRING:
+        return video_results[0]
 
-    return video_results[0]
+    return rank_query_results(request.raw_request, video_results)[0]
 
 
 def parse_string_query_result(result: dict) -> dict:
@@ -427,14 +1299,15 @@ def escape_discord_characters(title: str) -> str:
     return escaped_title
 
 
-def get_playlist_items(playlist_url: str) -> list[dict]:
-    """For a given playlist URL, find the individual videos in the playlist.
+async def iter_playlist_items(playlist_url: str) -> AsyncIterator[list[dict]]:
+    """For a given playlist URL, find the individual videos in the playlist one page at a time. While
+    a page is being consumed, the next page is fetched in the background.
 
     Args:
         playlist_url (str): The URL of the playlist.
 
-    Returns:
-        list[dict]: A list of dictionaries, where each item in the list contains data about a video in the playlist.
+    Yields:
+        list[dict]: A page of dictionaries, where each item contains data about a video in the playlist.
     """
     api = YOUTUBE_API.playlistItems()
     query = parse_qs(urlparse(playlist_url).query, keep_blank_values=True)
@@ -445,21 +1318,100 @@ def get_playlist_items(playlist_url: str) -> list[dict]:
 
     api_args = {"part": "snippet", "maxResults": 50, "playlistId": youtube_id}
 
+    def execute(request):
+        # The shared HTTP client is not thread safe, so each request uses its own.
+        return request.execute(http=build_http())
+
     api_request = api.list(**api_args)
+    next_page = asyncio.create_task(asyncio.to_thread(execute, api_request))
+    try:
+        while next_page:
+            response = await next_page
+            api_request = api.list_next(api_request, response)
+            next_page = (
+                asyncio.create_task(asyncio.to_thread(execute, api_request))
+                if api_request
+                else None
+            )
+            yield response["items"]
+    finally:
+        if next_page:
+            next_page.cancel()
+
+
+async def iter_playlist_songs(
+    original_request: str, original_member: Member
+) -> AsyncIterator[list["SongRequest"]]:
+    """For a given playlist request, get the videos in the playlist as SongRequests one page at a time.
+
+    Args:
+        original_request (str): The original raw request.
+        original_member (Member): The member that requested the playlist.
+
+    Yields:
+        list[SongRequest]: A page of the playlist's items converted into SongRequest objects.
+    """
+    playlist_pages = iter_playlist_items(original_request)
+    try:
+        async for playlist_items in playlist_pages:
+            yield parse_playlist_response(
+                original_request, original_member, playlist_items
+            )
+    finally:
+        await playlist_pages.aclose()
 
-    video_responses = []
-    while api_request:
-        response = api_request.execute()
-        video_responses += response["items"]
-        api_request = api.list_next(api_request, response)
 
-    return video_responses
+class PrefetchedPlaylist:
+    """The pages of a playlist whose first page has already been fetched, so that fetching the first page can be
+    timed and limited in the same way as resolving any other request.
+    """
+
+    def __init__(
+        self, first_page: list["SongRequest"], pages: AsyncIterator[list["SongRequest"]]
+    ):
+        self.first_page = first_page
+        self.pages = pages
+
+    @classmethod
+    async def fetch(
+        cls, pages: AsyncIterator[list["SongRequest"]]
+    ) -> Union["PrefetchedPlaylist", None]:
+        """Fetch the first page of a playlist.
+
+        Args:
+            pages (AsyncIterator[list[SongRequest]]): The pages of the playlist.
+
+        Returns:
+            Union[PrefetchedPlaylist, None]: The playlist, or None if the playlist is empty.
+        """
+        try:
+            first_page = await anext(pages)
+        except StopAsyncIteration:
+            await pages.aclose()
+            return None
+        except BaseException:
+            await pages.aclose()
+            raise
+        return cls(first_page, pages)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> list["SongRequest"]:
+        if self.first_page is not None:
+            page, self.first_page = self.first_page, None
+            return page
+        return await anext(self.pages)
+
+    async def aclose(self):
+        self.first_page = None
+        await self.pages.aclose()
 
 
 def parse_playlist_response(
     original_request: str, original_member: Member, playlist_items: list[dict]
 ) -> list[SongRequest]:
-    """Parse the data obtained from get_playlist_items to individual SongRequests.
+    """Parse the data obtained from iter_playlist_items to individual SongRequests.
 
     Args:
         original_request (str): The original raw request.
@@ -488,7 +1440,7 @@ def parse_playlist_item(item: dict) -> tuple[str, str, str]:
     """Parse an individual playlist item's data into a tuple of its title, url and thumbnail url.
 
     Args:
-        item (dict): The item obtained from get_playlist_items.
+        item (dict): The item obtained from iter_playlist_items.
 
     Returns:
         tuple[str, str, str]: A tuple containing the title, url and thumbnail of the video.
@@ -610,13 +1562,45 @@ def create_music_actionbar(is_paused: bool = True) -> View:
     view.add_item(volume_button)
     view.add_item(add_button)
     view.add_item(view_button)
-    # TOOD: Implement queue editing
-    # view.add_item(edit_button)
+    view.add_item(edit_button)
     view.add_item(stop_button)
 
     return view
 
 
+def create_queue_page_actionbar(page: int, page_count: int) -> View:
+    """Creates the View containing the buttons to move between the pages of the queue.
+
+    Args:
+        page (int): The index of the page being shown.
+        page_count (int): The number of pages in the queue.
+
+    Returns:
+        View: A view containing the previous and next page buttons.
+    """
+    view = View(timeout=None)
+
+    previous_button = Button(
+        style=ButtonStyle.secondary,
+        label=COG_STRINGS["music_button_previous_page"],
+        emoji="⬅️",
+        custom_id=UserActionType.QUEUE_PREVIOUS_PAGE.id,
+        disabled=page <= 0,
+    )
+    next_button = Button(
+        style=ButtonStyle.secondary,
+        label=COG_STRINGS["music_button_next_page"],
+        emoji="➡️",
+        custom_id=UserActionType.QUEUE_NEXT_PAGE.id,
+        disabled=page >= page_count - 1,
+    )
+
+    view.add_item(previous_button)
+    view.add_item(next_button)
+
+    return view
+
+
 @default_permissions(administrator=True)
 @guild_only()
 class VCMusicAdmin(GroupCog, name=COG_STRINGS["music_admin_group_name"]):
@@ -709,6 +1693,11 @@ class VCMusicAdmin(GroupCog, name=COG_STRINGS["music_admin_group_name"]):
             )
             DBSession.create(new_entry)
 
+        music_cog = self.bot.get_cog(COG_STRINGS["music_group_name"])
+        if music_cog:
+            music_cog.music_messages[interaction.guild.id] = message
+            await music_cog.update_embed(interaction.guild.id)
+
         await interaction.followup.send(
             content=COG_STRINGS["music_set_channel_success"].format(
                 channel=channel.mention
@@ -737,11 +1726,74 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
     def __init__(self, bot: Bot):
         self.bot = bot
         self.active_players: dict[int, GuildMusicPlayer] = {}
-        self.playing: list[int] = []
-        self.inactive: dict[int, datetime] = {}
+        self.playing: set[int] = set()
+        self.starting: set[int] = set()
+        self.inactive: dict[int, asyncio.TimerHandle] = {}
+        self.music_messages: dict[int, Union[Message, None]] = {}
+        self.pending_embed_updates: dict[int, asyncio.Task] = {}
+        self.resolve_limits: dict[int, asyncio.Semaphore] = {}
+        self.resolving: dict[int, int] = {}
+        self.snapshot_versions: dict[int, tuple] = {}
+        self.queue_pages: dict[tuple[int, int], int] = {}
+        self.preloaded: dict[int, PreloadedSong] = {}
+        self.preload_timers: dict[int, asyncio.TimerHandle] = {}
+        self.measuring_loudness: set[str] = set()
+        self.loudness_limit = asyncio.Semaphore(LOUDNESS_WORKERS)
+        self.metrics_runner = None
+        self.voice_events = VoiceEventClassifier()
+        MUSIC_METRICS.gauge(
+            "voice_events_skipped", lambda: {"": self.voice_events.skipped}
+        )
+        MUSIC_METRICS.gauge("active_players", lambda: {"": len(self.active_players)})
+        MUSIC_METRICS.gauge("playing_guilds", lambda: {"": len(self.playing)})
+        MUSIC_METRICS.gauge(
+            "ffmpeg_processes",
+            lambda: {str(x): y for x, y in FFMPEG_SUPERVISOR.counts().items()},
+        )
+        MUSIC_METRICS.gauge(
+            "queue_length",
+            lambda: {str(x): len(y.queue) for x, y in self.active_players.items()},
+        )
+        self.queue_page_cache: dict[int, tuple[int, dict[int, str]]] = {}
+        self.restored_snapshots = False
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"{__name__}.{__class__.__name__} has been added as a Cog")
 
+    async def cog_unload(self):
+        if self.supervise_processes.is_running():
+            self.supervise_processes.cancel()
+        if AUDIO_WORKER_POOL:
+            await asyncio.to_thread(AUDIO_WORKER_POOL.close)
+        if self.metrics_runner:
+            await self.metrics_runner.cleanup()
+            self.metrics_runner = None
+        if self.snapshot_queues.is_running():
+            self.snapshot_queues.cancel()
+        if QUEUE_SNAPSHOTS and self.restored_snapshots:
+            # Save every queue so that playback resumes from the current position.
+            self.snapshot_versions = dict.fromkeys(self.snapshot_versions)
+            await self.save_snapshots()
+
+    @GroupCog.listener()
+    async def on_ready(self):
+        if not self.supervise_processes.is_running():
+            self.supervise_processes.start()
+
+        if METRICS_PORT and not self.metrics_runner:
+            try:
+                self.metrics_runner = await start_metrics_server(
+                    MUSIC_METRICS, METRICS_PORT, METRICS_HOST
+                )
+            except OSError as e:
+                self.logger.error(f"Unable to start the music metrics server - {e}")
+
+        if not QUEUE_SNAPSHOTS or self.restored_snapshots:
+            return
+        self.restored_snapshots = True
+        await self.restore_snapshots()
+        if not self.snapshot_queues.is_running():
+            self.snapshot_queues.start()
+
     @GroupCog.listener()
     async def on_voice_state_update(
         self, member: Member, before: VoiceState, after: VoiceState
@@ -755,18 +1807,22 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             before (VoiceState): The VoiceState before the change.
             after (VoiceState): The VoiceState after the change.
         """
+        event = self.voice_events.classify(before, after)
+        if event == VoiceEvent.NOOP:
+            return
+
         guild_id = before.channel.guild.id if before.channel else after.channel.guild.id
         if member.id != self.bot.user.id:
-            if guild_id not in self.active_players:
+            # Only a member leaving the bot's channel can leave the bot abandoned
+            if event == VoiceEvent.JOIN or guild_id not in self.active_players:
                 return
 
-            if before.channel:
-                if before.channel.guild.me not in before.channel.members:
-                    return
-                members_left = [x for x in before.channel.members if not x.bot]
-                if not members_left:
-                    await self.active_players.get(guild_id).voice_client.disconnect()
-                    return
+            if before.channel.guild.me not in before.channel.members:
+                return
+            members_left = [x for x in before.channel.members if not x.bot]
+            if not members_left:
+                await self.active_players.get(guild_id).voice_client.disconnect()
+            return
 
         if before.channel and not after.channel:
             # Bot has disconnected from a channel, ensure that cleanup has occured
@@ -774,12 +1830,12 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             return
 
         if before.channel and after.channel:
+            MUSIC_METRICS.increment("voice_moves", guild_id)
             if guild_id in self.active_players:
                 self.active_players.get(guild_id).voice_client = (
                     after.channel.guild.voice_client
                 )
-            if guild_id in self.inactive:
-                self.inactive.pop(guild_id)
+            self.mark_active(guild_id)
             return
 
     @GroupCog.listener()
@@ -821,7 +1877,11 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             case UserActionType.VIEW_QUEUE:
                 return await self.get_current_queue(interaction)
             case UserActionType.EDIT_QUEUE:
-                pass
+                return await self.edit_queue_handler(interaction)
+            case UserActionType.QUEUE_PREVIOUS_PAGE:
+                return await self.change_queue_page(interaction, -1)
+            case UserActionType.QUEUE_NEXT_PAGE:
+                return await self.change_queue_page(interaction, 1)
             case UserActionType.STOP:
                 return await self.stop_playback(interaction)
             case UserActionType.VOLUME_MODAL_SUBMIT:
@@ -829,17 +1889,36 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             case UserActionType.ADD_SONG_MODAL_SUBMIT:
                 return await self.add_modal_interaction_handler(interaction)
             case UserActionType.EDIT_QUEUE_MODAL_SUBMIT:
-                pass
+                return await self.edit_queue_submit_handler(interaction)
             case _:
                 return False
 
     def run_tasks(self):
-        """Ensures that the check_playing and check_inactive tasks are running."""
+        """Ensures that the check_playing task is running."""
         if self.playing and not self.check_playing.is_running():
             self.check_playing.start()
 
-        if self.inactive and not self.check_inactive.is_running():
-            self.check_inactive.start()
+    def mark_inactive(self, guild_id: int):
+        """Mark a guild as inactive, scheduling it to be disconnected once INACTIVE_TIMEOUT has passed.
+
+        Args:
+            guild_id (int): The ID of the guild to mark as inactive.
+        """
+        self.mark_active(guild_id)
+        self.inactive[guild_id] = self.bot.loop.call_later(
+            INACTIVE_TIMEOUT,
+            lambda: self.bot.loop.create_task(self.disconnect_inactive(guild_id)),
+        )
+
+    def mark_active(self, guild_id: int):
+        """Ensure a guild is no longer marked as inactive, cancelling its scheduled disconnect.
+
+        Args:
+            guild_id (int): The ID of the guild to mark as active.
+        """
+        timer = self.inactive.pop(guild_id, None)
+        if timer:
+            timer.cancel()
 
     async def cleanup_after_disconnect(self, guild_id: int):
         """Ensures that a given guild is not left active, playing or inactive
@@ -849,60 +1928,266 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             guild_id (int): The ID of the guild to cleanup.
         """
         needs_update = False
+        self.discard_preload(guild_id)
+        killed = await asyncio.to_thread(FFMPEG_SUPERVISOR.kill, guild_id)
+        if killed:
+            self.logger.warning(
+                f"Killed {killed} ffmpeg process(es) left running in guild with id {guild_id}"
+            )
+            MUSIC_METRICS.increment("ffmpeg_processes_killed", guild_id, killed)
+        self.queue_page_cache.pop(guild_id, None)
+        if guild_id not in self.resolving:
+            self.resolve_limits.pop(guild_id, None)
+        for key in [x for x in self.queue_pages if x[0] == guild_id]:
+            self.queue_pages.pop(key)
         if guild_id in self.active_players:
             self.active_players.pop(guild_id)
             needs_update = True
         if guild_id in self.playing:
-            self.playing.remove(guild_id)
+            self.playing.discard(guild_id)
             needs_update = True
         if guild_id in self.inactive:
-            self.inactive.pop(guild_id)
+            self.mark_active(guild_id)
             needs_update = True
         if needs_update:
             await self.update_embed(guild_id)
 
-    @tasks.loop(seconds=5)
+    @tasks.loop(seconds=PROCESS_CHECK_INTERVAL)
+    async def supervise_processes(self):
+        """Stop tracking ffmpeg processes that have exited, and kill any that have run for longer
+        than the wall-clock limit of the FFMPEG_SUPERVISOR.
+        """
+        await asyncio.to_thread(FFMPEG_SUPERVISOR.reap)
+        killed = await asyncio.to_thread(FFMPEG_SUPERVISOR.enforce)
+        if killed:
+            MUSIC_METRICS.increment("ffmpeg_processes_killed", value=killed)
+
+    @tasks.loop(seconds=PLAYBACK_WATCHDOG_INTERVAL)
     async def check_playing(self):
-        """For each guild that is currently marked as playing, check if it's playback has stopped.
-        For those that have, attempt to play the next song, but if no next song mark as inactive.
+        """A watchdog for guilds that are marked as playing. Song transitions are handled by the
+        song_finished callback, so this only catches guilds whose playback has stopped without the
+        callback advancing the queue.
         """
         if not self.playing:
             self.check_playing.cancel()
             self.check_playing.stop()
             return
 
-        no_longer_active = []
-
-        for guild_id in self.playing:
+        for guild_id in list(self.playing):
+            if guild_id in self.starting:
+                continue
             voice_client = self.active_players.get(guild_id).voice_client
             if not voice_client.is_playing() and not voice_client.is_paused():
-                if not self.play_next_song(guild_id):
-                    no_longer_active.append(guild_id)
-                    self.end_playback(guild_id)
-                await self.update_embed(guild_id)
-
-        for guild in no_longer_active:
-            self.playing.remove(guild)
-
-    @tasks.loop(seconds=10)
-    async def check_inactive(self):
-        """For each guild marked as inactive, check if has been longer than INACTIVE_TIMEOUT since
-        it was marked as inactive, and if so disconnect it.
-        """
-        if not self.inactive:
-            self.check_inactive.cancel()
-            self.check_inactive.stop()
+                self.logger.warning(
+                    f"Playback in guild with id {guild_id} stalled, advancing queue"
+                )
+                MUSIC_METRICS.increment("playback_stalls", guild_id)
+                await self.advance_playback(guild_id)
+
+    def get_snapshot(self, guild_id: int) -> Union[dict, None]:
+        """Get the data needed to resume playback in a given guild after a restart.
+
+        Args:
+            guild_id (int): The ID of the guild to get the snapshot of.
+
+        Returns:
+            Union[dict, None]: The snapshot of the guild, or None if there is nothing to resume.
+        """
+        active_player = self.active_players.get(guild_id)
+        if not active_player or not active_player.voice_client:
+            return None
+
+        current = None
+        if active_player.current_song is not None:
+            song = active_player.current_song
+            source = active_player.voice_client.source
+            current = [
+                get_video_id(song.url) or song.url,
+                song.request_member.id,
+                (
+                    round(source.position, 2)
+                    if isinstance(source, MusicAudioSource)
+                    else 0
+                ),
+            ]
+
+        if current is None and not len(active_player.queue):
+            return None
+
+        video_ids, requester_ids = active_player.queue.ids()
+        return {
+            "channel_id": active_player.voice_client.channel.id,
+            "volume": active_player.volume,
+            "current": current,
+            "video_ids": video_ids,
+            "requester_ids": requester_ids,
+        }
+
+    async def save_snapshots(self):
+        """Save the state of every guild whose queue, current song or volume has changed since it was
+        last saved, and remove the saved state of guilds that are no longer playing.
+        """
+        snapshots = {}
+        stale = [x for x in self.snapshot_versions if x not in self.active_players]
+        for guild_id, active_player in self.active_players.items():
+            version = (
+                active_player.queue.version,
+                active_player.generation,
+                active_player.volume,
+            )
+            if self.snapshot_versions.get(guild_id) == version:
+                continue
+            self.snapshot_versions[guild_id] = version
+            snapshot = self.get_snapshot(guild_id)
+            if snapshot is None:
+                stale.append(guild_id)
+            else:
+                snapshots[guild_id] = snapshot
+
+        for guild_id in stale:
+            if guild_id not in self.active_players:
+                self.snapshot_versions.pop(guild_id, None)
+
+        if snapshots:
+            await asyncio.to_thread(QUEUE_SNAPSHOTS.save, snapshots)
+        if stale:
+            await asyncio.to_thread(QUEUE_SNAPSHOTS.delete, stale)
+
+    @tasks.loop(seconds=SNAPSHOT_INTERVAL)
+    async def snapshot_queues(self):
+        """Periodically save the queues of each guild, so that they can be resumed after a restart."""
+        try:
+            await self.save_snapshots()
+        except OSError as e:
+            self.logger.error(f"Unable to save music queues - {e}")
+
+    async def restore_snapshots(self):
+        """Resume playback in each guild that had a saved queue when the bot last stopped. Only the IDs
+        of each song are restored, the metadata and streams of each song are fetched again when needed.
+        Each guild is restored in its own task, so that a slow or failing guild does not hold up the others.
+        """
+        snapshots = await asyncio.to_thread(QUEUE_SNAPSHOTS.load_all)
+        unused = []
+        for key, snapshot in snapshots.items():
+            guild = self.bot.get_guild(int(key))
+            channel = guild.get_channel(snapshot.get("channel_id")) if guild else None
+            if not channel or not [x for x in channel.members if not x.bot]:
+                unused.append(key)
+                continue
+
+            self.bot.loop.create_task(self.restore_guild(key, guild, channel, snapshot))
+
+        if unused:
+            await asyncio.to_thread(QUEUE_SNAPSHOTS.delete, unused)
+
+    async def restore_guild(
+        self, key: str, guild: Guild, channel: VoiceChannel, snapshot: dict
+    ):
+        """Restore the saved queue of a guild. If it cannot be resumed, the bot leaves the channel, the guild is
+        no longer tracked as active and its saved queue is deleted.
+
+        Args:
+            key (str): The key of the saved queue.
+            guild (Guild): The guild in which to resume playback.
+            channel (VoiceChannel): The channel that the bot was playing in.
+            snapshot (dict): The saved state of the guild, as given by get_snapshot.
+        """
+        try:
+            await self.restore_snapshot(guild, channel, snapshot)
+        except Exception as e:
+            self.logger.error(f"Unable to resume music in guild {guild.id} - {e}")
+            if guild.voice_client:
+                await guild.voice_client.disconnect(force=True)
+            self.snapshot_versions.pop(guild.id, None)
+            await self.cleanup_after_disconnect(guild.id)
+            await asyncio.to_thread(QUEUE_SNAPSHOTS.delete, [key])
+
+    async def restore_snapshot(
+        self, guild: Guild, channel: VoiceChannel, snapshot: dict
+    ):
+        """Reconnect to the given channel and resume playback of a saved queue.
+
+        Args:
+            guild (Guild): The guild in which to resume playback.
+            channel (VoiceChannel): The channel that the bot was playing in.
+            snapshot (dict): The saved state of the guild, as given by get_snapshot.
+        """
+        voice_client = await channel.connect()
+        await guild.change_voice_state(channel=channel, self_deaf=True, self_mute=False)
+
+        active_player = GuildMusicPlayer(
+            guild=guild,
+            voice_client=voice_client,
+            volume=snapshot.get("volume", 100),
+        )
+        current = snapshot.get("current")
+        if current:
+            video_id, requester_id, position = current
+            active_player.queue.extend_entries([video_id], [requester_id])
+            active_player.resume_position = position
+        active_player.queue.extend_entries(
+            snapshot.get("video_ids", []), snapshot.get("requester_ids", [])
+        )
+        self.active_players[guild.id] = active_player
+        self.snapshot_versions[guild.id] = None
+        MUSIC_METRICS.increment("restored_queues", guild.id)
+
+        self.logger.info(
+            f"Resuming {len(active_player.queue)} songs in guild with id {guild.id}"
+        )
+        if await self.play_next_song(guild.id):
+            self.run_tasks()
+        else:
+            self.end_playback(guild.id)
+        await self.update_embed(guild.id)
+
+    async def advance_playback(self, guild_id: int):
+        """Play the next song in a given guild's queue, or end playback if the queue is empty.
+
+        Args:
+            guild_id (int): The ID of the guild to advance playback in.
+        """
+        if not await self.play_next_song(guild_id):
+            self.end_playback(guild_id)
+        await self.update_embed(guild_id)
+
+    async def song_finished(
+        self, guild_id: int, generation: int, error: Union[Exception, None]
+    ):
+        """Called on the event loop when the voice client of a guild finishes playing a song. If the
+        song that finished is still the guild's current song, playback moves onto the next song.
+
+        Args:
+            guild_id (int): The ID of the guild in which the song finished.
+            generation (int): The generation of the guild's player when the song was started.
+            error (Union[Exception, None]): The error raised during playback, if any.
+        """
+        if error:
+            MUSIC_METRICS.increment("playback_errors", guild_id)
+            self.logger.error(
+                f"Encountered an error during playback in guild with id {guild_id} - {error}"
+            )
+
+        active_player = self.active_players.get(guild_id)
+        if not active_player or active_player.generation != generation:
+            # The song was skipped or stopped, which is handled by whatever stopped it.
             return
 
-        now = datetime.now()
-        guilds_to_disconnect = []
+        await self.advance_playback(guild_id)
 
-        for guild_id in self.inactive:
-            if (now - self.inactive.get(guild_id)).seconds > INACTIVE_TIMEOUT:
-                guilds_to_disconnect.append(guild_id)
+    async def disconnect_inactive(self, guild_id: int):
+        """Disconnect a guild that has been inactive for INACTIVE_TIMEOUT seconds.
 
-        for guild in guilds_to_disconnect:
-            await self.active_players.get(guild).voice_client.disconnect()
+        Args:
+            guild_id (int): The ID of the guild to disconnect.
+        """
+        if self.inactive.pop(guild_id, None) is None:
+            return
+
+        active_player = self.active_players.get(guild_id)
+        if active_player and active_player.voice_client:
+            MUSIC_METRICS.increment("idle_disconnects", guild_id)
+            await active_player.voice_client.disconnect()
 
     def check_valid_user(self, guild: Guild, user: Member) -> bool:
         """Checks if a given user is allowed to control the music bot at
@@ -946,17 +2231,109 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             )
             return False
 
-        current_queue = self.active_players.get(interaction.guild.id).queue
-        shuffle(current_queue)
-        self.active_players.get(interaction.guild.id).queue = current_queue
+        self.active_players.get(interaction.guild.id).queue.shuffle()
+        self.refresh_preload(interaction.guild.id)
+        await respond_or_followup(
+            COG_STRINGS["music_shuffle_queue_success"], interaction, ephemeral=True
+        )
+
+    async def set_volume_handler(self, interaction: Interaction) -> bool:
+        """The interaction handler for when the custom ID of an interaction
+        matches the UserActionType of VOLUME. This handler will perform the
+        necessary checks, and if successful will show a modal to set the volume.
+
+        Args:
+            interaction (Interaction): The interaction to handle.
+        """
+        if not self.check_valid_user(interaction.guild, interaction.user):
+            await respond_or_followup(
+                COG_STRINGS["music_invalid_voice"], interaction, ephemeral=True
+            )
+            return False
+
+        if interaction.guild.id not in self.active_players:
+            await respond_or_followup(
+                COG_STRINGS["music_warn_not_playing"], interaction, ephemeral=True
+            )
+            return False
+
+        modal = Modal(
+            title=COG_STRINGS["music_volume_modal_title"],
+            timeout=None,
+            custom_id=UserActionType.VOLUME_MODAL_SUBMIT.id,
+        )
+
+        volume = TextInput(
+            label=COG_STRINGS["music_volume_modal_volume"],
+            custom_id=UserActionType.VOLUME_MODAL_VALUE.id,
+            required=True,
+        )
+
+        modal.add_item(volume)
+        await interaction.response.send_modal(modal)
+        return True
+
+    async def set_volume_submit_handler(self, interaction: Interaction) -> bool:
+        """The handler for when the custom ID of an interaction matches the UserActionType
+        of VOLUME_MODAL_SUBMIT. This handler will perform the necessary checks, and if
+        successful, will set the volume of the playback to given volume.
+
+        Args:
+            interaction (Interaction): The interaction to handle.
+        """
+        if not self.check_valid_user(interaction.guild, interaction.user):
+            await respond_or_followup(
+                COG_STRINGS["music_invalid_voice"], interaction, ephemeral=True
+            )
+            return False
+
+        if interaction.guild.id not in self.active_players:
+            await respond_or_followup(
+                COG_STRINGS["music_warn_not_playing"], interaction, ephemeral=True
+            )
+            return False
+
+        raw_modal_data = interaction.data.get("components")
+
+        raw_volume_value = ""
+
+        for item in raw_modal_data:
+            if (
+                item.get("components")[0].get("custom_id")
+                == UserActionType.VOLUME_MODAL_VALUE.id
+            ):
+                raw_volume_value = item.get("components")[0].get("value")
+                break
+
+        if not raw_volume_value.isdigit():
+            await respond_or_followup(
+                COG_STRINGS["music_volume_modal_invalid"].format(
+                    supplied=raw_volume_value
+                ),
+                interaction,
+                ephemeral=True,
+            )
+            return False
+
+        volume_value = int(raw_volume_value)
+        if volume_value < 0:
+            volume_value = 0
+        elif volume_value > 100:
+            volume_value = 100
+
+        self.apply_volume(interaction.guild.id, volume_value)
+        await self.update_embed(interaction.guild.id)
         await respond_or_followup(
-            COG_STRINGS["music_shuffle_queue_success"], interaction, ephemeral=True
+            COG_STRINGS["music_volume_set_success"].format(value=volume_value),
+            interaction,
         )
+        return True
 
-    async def set_volume_handler(self, interaction: Interaction) -> bool:
-        """The interaction handler for when the custom ID of an interaction
-        matches the UserActionType of VOLUME. This handler will perform the
-        necessary checks, and if successful will show a modal to set the volume.
+    async def edit_queue_handler(self, interaction: Interaction) -> bool:
+        """The interaction handler for when the custom ID of an interaction matches
+        the UserActionType of EDIT_QUEUE. This handler will perform the necessary checks,
+        and if successful, will show the modal to allow the user to move or remove a song
+        in the queue.
 
         Args:
             interaction (Interaction): The interaction to handle.
@@ -974,25 +2351,33 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             return False
 
         modal = Modal(
-            title=COG_STRINGS["music_volume_modal_title"],
+            title=COG_STRINGS["music_edit_queue_modal_title"],
             timeout=None,
-            custom_id=UserActionType.VOLUME_MODAL_SUBMIT.id,
+            custom_id=UserActionType.EDIT_QUEUE_MODAL_SUBMIT.id,
         )
 
-        volume = TextInput(
-            label=COG_STRINGS["music_volume_modal_volume"],
-            custom_id=UserActionType.VOLUME_MODAL_VALUE.id,
+        position = TextInput(
+            label=COG_STRINGS["music_edit_queue_modal_position"],
+            custom_id=UserActionType.EDIT_QUEUE_MODAL_POSITION.id,
             required=True,
         )
 
-        modal.add_item(volume)
+        new_position = TextInput(
+            label=COG_STRINGS["music_edit_queue_modal_new_position"],
+            custom_id=UserActionType.EDIT_QUEUE_MODAL_NEW_POSITION.id,
+            required=False,
+        )
+
+        modal.add_item(position)
+        modal.add_item(new_position)
         await interaction.response.send_modal(modal)
         return True
 
-    async def set_volume_submit_handler(self, interaction: Interaction) -> bool:
+    async def edit_queue_submit_handler(self, interaction: Interaction) -> bool:
         """The handler for when the custom ID of an interaction matches the UserActionType
-        of VOLUME_MODAL_SUBMIT. This handler will perform the necessary checks, and if
-        successful, will set the volume of the playback to given volume.
+        of EDIT_QUEUE_MODAL_SUBMIT. This handler will perform the necessary checks, and if
+        successful, will move the given song to its new position in the queue, or remove it
+        from the queue if no new position was given.
 
         Args:
             interaction (Interaction): The interaction to handle.
@@ -1011,41 +2396,53 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
 
         raw_modal_data = interaction.data.get("components")
 
-        raw_volume_value = ""
+        raw_position = ""
+        raw_new_position = ""
 
         for item in raw_modal_data:
             if (
                 item.get("components")[0].get("custom_id")
-                == UserActionType.VOLUME_MODAL_VALUE.id
+                == UserActionType.EDIT_QUEUE_MODAL_POSITION.id
             ):
-                raw_volume_value = item.get("components")[0].get("value")
-                break
+                raw_position = item.get("components")[0].get("value").strip()
+            elif (
+                item.get("components")[0].get("custom_id")
+                == UserActionType.EDIT_QUEUE_MODAL_NEW_POSITION.id
+            ):
+                raw_new_position = item.get("components")[0].get("value").strip()
 
-        if not raw_volume_value.isdigit():
-            await respond_or_followup(
-                COG_STRINGS["music_volume_modal_invalid"].format(
-                    supplied=raw_volume_value
-                ),
-                interaction,
-                ephemeral=True,
-            )
-            return False
+        current_queue = self.active_players.get(interaction.guild.id).queue
+        positions = []
+        for supplied, required in ((raw_position, True), (raw_new_position, False)):
+            if not supplied and not required:
+                positions.append(None)
+                continue
+            try:
+                parsed = int(supplied)
+            except ValueError:
+                parsed = None
+            if parsed is None or not 1 <= parsed <= len(current_queue):
+                await respond_or_followup(
+                    COG_STRINGS["music_edit_queue_invalid"].format(supplied=supplied),
+                    interaction,
+                    ephemeral=True,
+                )
+                return False
+            positions.append(parsed)
 
-        volume_value = int(raw_volume_value)
-        if volume_value < 0:
-            volume_value = 0
-        elif volume_value > 100:
-            volume_value = 100
+        position, new_position = positions
+        if new_position is not None:
+            current_queue.move(position - 1, new_position - 1)
+            message = COG_STRINGS["music_edit_queue_moved"].format(
+                position=position, new_position=new_position
+            )
+        else:
+            current_queue.remove(position - 1)
+            message = COG_STRINGS["music_edit_queue_removed"].format(position=position)
+        self.refresh_preload(interaction.guild.id)
 
-        self.active_players.get(interaction.guild.id).voice_client.source.volume = (
-            float(volume_value) / float(100)
-        )
-        self.active_players.get(interaction.guild.id).volume = volume_value
         await self.update_embed(interaction.guild.id)
-        await respond_or_followup(
-            COG_STRINGS["music_volume_set_success"].format(value=volume_value),
-            interaction,
-        )
+        await respond_or_followup(message, interaction, ephemeral=True)
         return True
 
     async def add_interaction_hanlder(self, interaction: Interaction) -> bool:
@@ -1142,40 +2539,146 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
                 )
             ] + request_list
 
-        first_success = 0
-        if request_list:
-            first_request = request_list.pop(0)
-            song = await first_request.get_song()
-            if song is None or song is []:
-                first_request = 0
-            elif await self.try_play_queue(
-                interaction, add_to_queue=song if isinstance(song, list) else [song]
-            ):
-                first_success = len(song) if isinstance(song, list) else 1
-
-        failed_requests = []
-        requests_to_queue = []
-        for request in request_list:
-            result = await request.get_song()
-            if result is None:
-                failed_requests.append(request)
-            elif isinstance(result, list):
-                requests_to_queue += result
-            else:
-                requests_to_queue.append(result)
+        # Resolve the requests concurrently, but queue them in the order they were given so
+        # that playback can start as soon as the first request has been resolved.
+        resolve_limit = self.resolve_limits.setdefault(
+            interaction.guild.id, asyncio.Semaphore(RESOLVE_WORKERS)
+        )
+        self.resolving[interaction.guild.id] = (
+            self.resolving.get(interaction.guild.id, 0) + 1
+        )
+        resolve_tasks = [
+            asyncio.create_task(
+                self.resolve_request(request, resolve_limit, interaction.guild.id)
+            )
+            for request in request_list
+        ]
+
+        added_count = 0
+        try:
+            for resolve_task in resolve_tasks:
+                song = await resolve_task
+                if not song:
+                    continue
+
+                if isinstance(song, SongRequest):
+                    queued_count = await self.queue_songs(interaction, [song])
+                else:
+                    queued_count = await self.queue_playlist(interaction, song)
+
+                if queued_count is None:
+                    break
+                added_count += queued_count
+        finally:
+            # Stop resolving the requests that were not queued, and close any playlists they gave
+            cancelled = []
+            for resolve_task in resolve_tasks:
+                if not resolve_task.done():
+                    resolve_task.cancel()
+                    cancelled.append(resolve_task)
+                elif not resolve_task.cancelled() and isinstance(
+                    resolve_task.result(), PrefetchedPlaylist
+                ):
+                    await resolve_task.result().aclose()
+            for result in await asyncio.gather(*cancelled, return_exceptions=True):
+                if isinstance(result, PrefetchedPlaylist):
+                    await result.aclose()
+
+            # The semaphore is only dropped once no other requests in the guild are using it. Guilds with a
+            # player keep theirs until they disconnect.
+            self.resolving[interaction.guild.id] -= 1
+            if not self.resolving[interaction.guild.id]:
+                self.resolving.pop(interaction.guild.id)
+                if interaction.guild.id not in self.active_players:
+                    self.resolve_limits.pop(interaction.guild.id, None)
 
         await respond_or_followup(
-            COG_STRINGS["music_added_song_count"].format(
-                count=len(request_list) - len(failed_requests) + first_success
-            ),
+            COG_STRINGS["music_added_song_count"].format(count=added_count),
             interaction,
             ephemeral=True,
         )
 
-        await self.try_play_queue(interaction, add_to_queue=requests_to_queue)
-
         return True
 
+    async def queue_songs(
+        self, interaction: Interaction, songs: list[SongRequest]
+    ) -> Union[int, None]:
+        """Add the given songs to the queue of the guild from which the interaction came, up to MAX_QUEUE_LENGTH
+        songs, and start playback if it is not already playing.
+
+        Args:
+            interaction (Interaction): The interaction that requested the songs.
+            songs (list[SongRequest]): The songs to add to the queue.
+
+        Returns:
+            Union[int, None]: The number of songs added to the queue, or None if the queue cannot be added to.
+        """
+        active_player = self.active_players.get(interaction.guild.id)
+        if active_player:
+            songs = songs[: max(MAX_QUEUE_LENGTH - len(active_player.queue), 0)]
+            if not songs:
+                return None
+
+        if not await self.try_play_queue(interaction, add_to_queue=songs):
+            return None
+        return len(songs)
+
+    async def queue_playlist(
+        self, interaction: Interaction, playlist: PrefetchedPlaylist
+    ) -> Union[int, None]:
+        """Add the songs from a playlist to the queue as each page of the playlist is fetched. Stops fetching the
+        playlist once the queue holds MAX_QUEUE_LENGTH songs, or if a page cannot be fetched.
+
+        Args:
+            interaction (Interaction): The interaction that requested the playlist.
+            playlist (PrefetchedPlaylist): The pages of songs in the playlist.
+
+        Returns:
+            Union[int, None]: The number of songs added to the queue, or None if no songs could be added.
+        """
+        added_count = None
+        try:
+            async for songs in playlist:
+                queued_count = await self.queue_songs(interaction, songs)
+                if queued_count is None:
+                    break
+                added_count = (added_count or 0) + queued_count
+        except Exception as error:
+            MUSIC_METRICS.increment("resolve_failures", interaction.guild.id)
+            self.logger.warning(f"Unable to queue the rest of a playlist - {error}")
+        finally:
+            await playlist.aclose()
+        return added_count
+
+    async def resolve_request(
+        self, request: SongRequest, resolve_limit: asyncio.Semaphore, guild_id: int
+    ) -> Union[PrefetchedPlaylist, SongRequest, None]:
+        """Resolve a song request, limiting how many requests are resolved at once in a guild. For playlists,
+        only the first page is fetched here, and the rest are fetched as the playlist is queued.
+
+        Args:
+            request (SongRequest): The request to resolve.
+            resolve_limit (asyncio.Semaphore): The semaphore limiting the guild's concurrent requests.
+            guild_id (int): The ID of the guild the request was made in.
+
+        Returns:
+            Union[PrefetchedPlaylist, SongRequest, None]: The result of the request's get_song, or None if it failed.
+        """
+        async with resolve_limit:
+            started = perf_counter()
+            try:
+                song = await request.get_song()
+                if song is not None and not isinstance(song, SongRequest):
+                    song = await PrefetchedPlaylist.fetch(song)
+            except Exception as error:
+                MUSIC_METRICS.increment("resolve_failures", guild_id)
+                self.logger.warning(
+                    f"Unable to resolve song request {request.raw_request} - {error}"
+                )
+                return None
+            MUSIC_METRICS.observe("resolve_seconds", perf_counter() - started, guild_id)
+            return song
+
     async def try_play_queue(
         self, interaction: Interaction, add_to_queue: list = []
     ) -> bool:
@@ -1207,6 +2710,7 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
         elif not interaction.guild.me.voice or not interaction.guild.me.voice.channel:
             voice_client = await interaction.user.voice.channel.connect()
             self.active_players[interaction.guild.id].voice_client = voice_client
+            MUSIC_METRICS.increment("voice_reconnects", interaction.guild.id)
 
         if not interaction.guild.me.voice.deaf:
             await interaction.guild.change_voice_state(
@@ -1215,7 +2719,9 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
                 self_mute=False,
             )
 
-        self.active_players[interaction.guild.id].queue += add_to_queue
+        self.mark_active(interaction.guild.id)
+        self.active_players[interaction.guild.id].queue.extend(add_to_queue)
+        self.refresh_preload(interaction.guild.id)
 
         is_playing = self.active_players[interaction.guild.id].voice_client.is_playing()
         is_paused = self.active_players[interaction.guild.id].voice_client.is_paused()
@@ -1233,7 +2739,7 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
                 )
             return True
 
-        if self.play_next_song(interaction.guild.id):
+        if await self.play_next_song(interaction.guild.id):
             self.run_tasks()
             if not await self.update_embed(interaction.guild.id):
                 await respond_or_followup(
@@ -1245,45 +2751,375 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             return True
         return False
 
-    def play_next_song(self, guild_id: int) -> bool:
+    async def play_next_song(self, guild_id: int) -> bool:
         """Get the next song in the queue and play it. Does not check if the current song
         has ended. If there are no songs in the queue, simply returns and does not modify
-        playback of the current song if any.
+        playback of the current song if any. The source of the song is created off the event
+        loop, as its stream may need to be fetched.
 
         Args:
             guild_id (int): The ID of the guild in which to play the next song.
 
         Returns:
-            bool: If a new song was started.
+            bool: If a new song was started, or if playback was changed elsewhere while the song was being prepared.
+        """
+        active_player = self.active_players[guild_id]
+        while True:
+            try:
+                video_id, requester_id = active_player.queue.pop()
+            except IndexError:
+                return False
+
+            voice_client = active_player.voice_client
+            if voice_client.is_playing() or voice_client.is_paused():
+                voice_client.stop()
+
+            # Any song started or stopped while this one is being prepared changes the generation again.
+            active_player.generation += 1
+            generation = active_player.generation
+            volume = active_player.volume
+            start_offset = active_player.resume_position
+            active_player.resume_position = 0
+
+            preloaded = self.preloaded.pop(guild_id, None)
+            self.discard_preload(guild_id)
+            if preloaded:
+                preloaded.release()
+            if preloaded and preloaded.video_id == video_id and not start_offset:
+                MUSIC_METRICS.increment("preloaded_plays", guild_id)
+                next_song = preloaded.song
+                voice_source = preloaded.source
+                stream_data = preloaded.stream_data
+                if voice_source.volume != volume:
+                    new_source = voice_source.with_volume(volume)
+                    if new_source is not voice_source:
+                        MUSIC_METRICS.increment("ffmpeg_restarts", guild_id)
+                        voice_source.cleanup()
+                    voice_source = new_source
+                break
+
+            if preloaded:
+                preloaded.source.cleanup()
+            next_song = song_from_entry(video_id, requester_id, active_player.guild)
+            self.starting.add(guild_id)
+            try:
+                voice_source, stream_data = await asyncio.to_thread(
+                    create_song_source,
+                    video_id,
+                    next_song,
+                    volume,
+                    start_offset,
+                    get_track_gain(video_id),
+                    guild_id,
+                )
+            except Exception as error:
+                # The video may have been removed or made private, so move onto the next song instead.
+                self.logger.warning(
+                    f"Unable to play video with id {video_id} in guild with id {guild_id} - {error}"
+                )
+                MUSIC_METRICS.increment("play_failures", guild_id)
+                if (
+                    self.active_players.get(guild_id) is not active_player
+                    or active_player.generation != generation
+                ):
+                    return True
+                active_player.current_song = None
+                continue
+            finally:
+                self.starting.discard(guild_id)
+
+            if (
+                self.active_players.get(guild_id) is not active_player
+                or active_player.generation != generation
+            ):
+                voice_source.cleanup()
+                return True
+            break
+
+        active_player.current_song = next_song
+
+        MUSIC_METRICS.increment("songs_played", guild_id)
+        voice_source.play_started = perf_counter()
+        active_player.voice_client.play(
+            voice_source,
+            after=lambda error: asyncio.run_coroutine_threadsafe(
+                self.song_finished(guild_id, generation, error), self.bot.loop
+            ),
+        )
+        self.playing.add(guild_id)
+        self.record_song_source(video_id, next_song, stream_data)
+        self.schedule_preload(guild_id)
+
+        return True
+
+    def record_song_source(
+        self,
+        video_id: str,
+        song: SongRequest,
+        stream_data: Union[StreamRecord, None],
+    ):
+        """Store the metadata of a song whose source has been created, and add it to the audio cache if needed.
+
+        Args:
+            video_id (str): The video ID of the song.
+            song (SongRequest): The song that the source was created for.
+            stream_data (Union[StreamRecord, None]): The stream data of the song, or None if it was played from the
+            audio cache.
+        """
+        TRACK_METADATA.update(
+            video_id,
+            title=song.title,
+            thumbnail=song.thumbnail,
+            stream_data=stream_data,
+        )
+        if stream_data is not None and "/" not in video_id:
+            self.try_cache_song(video_id, stream_data)
+        self.try_measure_loudness(video_id, song)
+
+    def try_measure_loudness(self, video_id: str, song: SongRequest):
+        """Measure the loudness of a song in the background if it has not been measured yet, so that
+        it can be normalised the next time it is played. Does nothing if TARGET_LOUDNESS is not set, or
+        if a previous measurement of the song failed and its retry time has not yet passed.
+
+        Args:
+            video_id (str): The video ID of the song.
+            song (SongRequest): The song to measure.
+        """
+        if TARGET_LOUDNESS is None or video_id in self.measuring_loudness:
+            return
+        metadata = TRACK_METADATA.get(video_id)
+        if metadata is None or metadata.loudness is not None:
+            return
+        if metadata.loudness_retry_at > time():
+            return
+
+        self.measuring_loudness.add(video_id)
+        self.bot.loop.create_task(self.measure_track_loudness(video_id, song))
+
+    async def measure_track_loudness(self, video_id: str, song: SongRequest):
+        """Measure the loudness of a song and store it in TRACK_METADATA, limited to LOUDNESS_WORKERS at once.
+        Songs in the audio cache are measured from their local file, otherwise the stream of the song is
+        refreshed first if it has expired. If the measurement fails, it is not retried until an exponentially
+        increasing delay has passed.
+
+        Args:
+            video_id (str): The video ID of the song.
+            song (SongRequest): The song to measure.
         """
+        loudness = None
         try:
-            next_song = self.active_players[guild_id].queue.pop(0)
-        except IndexError:
-            return False
+            async with self.loudness_limit:
+                cached_file = (
+                    AUDIO_CACHE.get(video_id)
+                    if AUDIO_CACHE and "/" not in video_id
+                    else None
+                )
+                if cached_file:
+                    loudness = await asyncio.to_thread(measure_loudness, cached_file)
+                else:
+                    stream_data = await asyncio.to_thread(song.get_stream_data)
+                    loudness = await asyncio.to_thread(
+                        measure_loudness,
+                        stream_data.url,
+                        FFMPEG_PLAYER_OPTIONS,
+                        stream_data.headers,
+                    )
+        except Exception as error:
+            self.logger.warning(
+                f"Unable to measure the loudness of video with id {video_id} - {error}"
+            )
+        finally:
+            self.measuring_loudness.discard(video_id)
 
-        if self.active_players[guild_id].voice_client.is_playing():
-            self.active_players[guild_id].voice_client.stop()
+        if loudness is not None:
+            TRACK_METADATA.update(video_id, loudness=loudness)
+            return
 
-        if next_song.stream_data is None:
-            stream_data = next_song.get_stream_data()
-        else:
-            stream_data = next_song.stream_data
+        metadata = TRACK_METADATA.get(video_id)
+        if metadata is not None:
+            metadata.loudness_failures += 1
+            metadata.loudness_retry_at = time() + min(
+                LOUDNESS_RETRY_SECONDS * 2 ** (metadata.loudness_failures - 1),
+                MAX_LOUDNESS_RETRY_SECONDS,
+            )
+
+    def schedule_preload(self, guild_id: int):
+        """Schedule the next song in a guild's queue to be prepared PRELOAD_SECONDS before the current song ends,
+        so that ffmpeg has already connected to its stream when it starts. Does nothing if the duration of the
+        current song is unknown.
+
+        Args:
+            guild_id (int): The ID of the guild to prepare the next song for.
+        """
+        timer = self.preload_timers.pop(guild_id, None)
+        if timer:
+            timer.cancel()
 
-        self.active_players[guild_id].current_song = next_song
+        active_player = self.active_players.get(guild_id)
+        if not PRELOAD_SECONDS or not active_player or not active_player.voice_client:
+            return
+        current_source = active_player.voice_client.source
+        if (
+            not isinstance(current_source, MusicAudioSource)
+            or not current_source.duration
+        ):
+            return
 
-        voice_source = PCMVolumeTransformer(
-            FFmpegPCMAudio(
-                stream_data.get("url"),
-                before_options=FFMPEG_PLAYER_OPTIONS,
-                options="-vn",
+        generation = active_player.generation
+        delay = max(
+            0,
+            current_source.duration
+            - current_source.position
+            - max(PRELOAD_SECONDS, CROSSFADE_SECONDS + 1),
+        )
+        self.preload_timers[guild_id] = self.bot.loop.call_later(
+            delay,
+            lambda: self.bot.loop.create_task(
+                self.preload_next_song(guild_id, generation)
             ),
-            volume=float(self.active_players.get(guild_id).volume) / float(100),
         )
 
-        self.active_players[guild_id].voice_client.play(voice_source)
-        self.playing.append(guild_id)
+    async def preload_next_song(self, guild_id: int, generation: int):
+        """Create the source of the next song in a guild's queue ahead of time. If crossfading is enabled, the
+        source is also given to the current source so that the two songs can be mixed.
 
-        return True
+        Args:
+            guild_id (int): The ID of the guild to prepare the next song for.
+            generation (int): The generation of the guild's player when the preload was scheduled.
+        """
+        self.preload_timers.pop(guild_id, None)
+        active_player = self.active_players.get(guild_id)
+        if not active_player or active_player.generation != generation:
+            return
+        if guild_id in self.preloaded or not len(active_player.queue):
+            return
+
+        video_id, requester_id = active_player.queue.entries(0, 1)[0]
+        next_song = song_from_entry(video_id, requester_id, active_player.guild)
+        try:
+            source, stream_data = await asyncio.to_thread(
+                create_song_source,
+                video_id,
+                next_song,
+                active_player.volume,
+                0,
+                get_track_gain(video_id),
+                guild_id,
+            )
+        except Exception as error:
+            self.logger.warning(
+                f"Unable to preload the next song in guild with id {guild_id} - {error}"
+            )
+            return
+
+        if (
+            self.active_players.get(guild_id) is not active_player
+            or active_player.generation != generation
+            or guild_id in self.preloaded
+        ):
+            source.cleanup()
+            return
+
+        preloaded = PreloadedSong(video_id, next_song, source, stream_data)
+        self.preloaded[guild_id] = preloaded
+
+        current_source = active_player.voice_client.source
+        if (
+            CROSSFADE_SECONDS
+            and isinstance(current_source, MusicAudioSource)
+            and not current_source.is_opus()
+            and not source.is_opus()
+        ):
+            current_source.set_next_source(source)
+            preloaded.mixed_into = current_source
+
+    def discard_preload(self, guild_id: int):
+        """Cancel any scheduled preload in a guild and clean up the preloaded source, if there is one.
+
+        Args:
+            guild_id (int): The ID of the guild to discard the preloaded song of.
+        """
+        timer = self.preload_timers.pop(guild_id, None)
+        if timer:
+            timer.cancel()
+
+        preloaded = self.preloaded.pop(guild_id, None)
+        if preloaded is None:
+            return
+
+        preloaded.release()
+        preloaded.source.cleanup()
+
+    def refresh_preload(self, guild_id: int):
+        """Ensure that the preloaded song of a guild is still the next song in its queue, preparing the new
+        next song if the queue has changed.
+
+        Args:
+            guild_id (int): The ID of the guild whose queue has changed.
+        """
+        active_player = self.active_players.get(guild_id)
+        if not active_player or active_player.current_song is None:
+            return
+
+        preloaded = self.preloaded.get(guild_id)
+        next_entries = active_player.queue.entries(0, 1)
+        if preloaded and next_entries and preloaded.video_id == next_entries[0][0]:
+            return
+
+        self.discard_preload(guild_id)
+        self.schedule_preload(guild_id)
+
+    def apply_volume(self, guild_id: int, volume: int):
+        """Set the volume of a given guild's playback, and apply it to the current song if there is one.
+
+        Args:
+            guild_id (int): The ID of the guild to set the volume of.
+            volume (int): The volume percentage between 0 and 100.
+        """
+        active_player = self.active_players.get(guild_id)
+        active_player.volume = volume
+
+        voice_client = active_player.voice_client
+        current_source = voice_client.source if voice_client else None
+        if not isinstance(current_source, MusicAudioSource):
+            return
+
+        new_source = current_source.with_volume(volume)
+        if new_source is current_source:
+            return
+        MUSIC_METRICS.increment("ffmpeg_restarts", guild_id)
+
+        # Swapping the source of the voice client resumes playback, so ensure it stays paused.
+        was_paused = voice_client.is_paused()
+        voice_client.source = new_source
+        current_source.cleanup()
+        if was_paused:
+            voice_client.pause()
+
+    def try_cache_song(self, video_id: Union[str, None], stream_data: StreamRecord):
+        """Record a play of the given video, and if it has been played enough times, add it to the
+        local audio cache in the background. Does nothing if the audio cache is not enabled.
+
+        Args:
+            video_id (Union[str, None]): The ID of the video that is being played.
+            stream_data (StreamRecord): The data from which the audio of the video can be streamed.
+        """
+        if not AUDIO_CACHE or not video_id or not stream_data.url:
+            return
+
+        if not AUDIO_CACHE.record_play(video_id):
+            return
+
+        self.logger.info(f"Adding video with id {video_id} to the audio cache")
+        self.bot.loop.create_task(
+            asyncio.to_thread(
+                AUDIO_CACHE.store,
+                video_id,
+                stream_data.url,
+                FFMPEG_PLAYER_OPTIONS,
+                stream_data.headers,
+            )
+        )
 
     async def resume_or_start_playback(self, interaction: Interaction) -> bool:
         """The interaction handler for when the custom ID matches the UserActionType
@@ -1303,7 +3139,7 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             return await self.add_interaction_hanlder(interaction)
 
         if interaction.guild.id in self.inactive:
-            self.inactive.pop(interaction.guild.id)
+            self.mark_active(interaction.guild.id)
             return await self.add_interaction_hanlder(interaction)
 
         if self.active_players.get(interaction.guild.id).voice_client.is_playing():
@@ -1394,7 +3230,8 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             )
             return False
 
-        if self.play_next_song(interaction.guild.id):
+        MUSIC_METRICS.increment("skips", interaction.guild.id)
+        if await self.play_next_song(interaction.guild.id):
             if not await self.update_embed(interaction.guild.id):
                 await respond_or_followup(
                     COG_STRINGS["music_needs_setup"],
@@ -1422,7 +3259,8 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
 
     # TODO: Rename this.
     async def get_current_queue(self, interaction: Interaction) -> bool:
-        """Handles sending the current queue to a user that requested it.
+        """Handles sending the current queue to a user that requested it. The queue is shown a page at a time,
+        starting from the first page.
 
         Args:
             interaction (Interaction): The interaction of the requesting user.
@@ -1434,43 +3272,96 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             )
             return True
 
-        current_queue = self.active_players.get(interaction.guild.id).queue
-        current_song = self.active_players.get(interaction.guild.id).current_song
+        self.queue_pages[(interaction.guild.id, interaction.user.id)] = 0
+        queue_text, view = await self.render_queue_view(interaction.guild.id, 0)
+        await respond_or_followup(
+            queue_text, interaction, ephemeral=True, delete_after=None, view=view
+        )
+        return True
+
+    async def change_queue_page(self, interaction: Interaction, step: int) -> bool:
+        """The interaction handler for when the custom ID of an interaction matches the UserActionType of
+        QUEUE_PREVIOUS_PAGE or QUEUE_NEXT_PAGE. Moves the queue view of the user by the given number of pages.
+
+        Args:
+            interaction (Interaction): The interaction to handle.
+            step (int): The number of pages to move by.
+        """
+        await interaction.response.defer()
+        if interaction.guild.id not in self.active_players:
+            await interaction.edit_original_response(
+                content=COG_STRINGS["music_warn_view_queue_empty"], view=None
+            )
+            return False
+
+        key = (interaction.guild.id, interaction.user.id)
+        page = self.queue_pages.get(key, 0) + step
+        queue_text, view = await self.render_queue_view(interaction.guild.id, page)
+        self.queue_pages[key] = page
+        await interaction.edit_original_response(content=queue_text, view=view)
+        return True
+
+    async def render_queue_view(self, guild_id: int, page: int) -> tuple[str, View]:
+        """Get the text and buttons to show a given page of a guild's queue.
+
+        Args:
+            guild_id (int): The ID of the guild whose queue to show.
+            page (int): The index of the page to show. Pages out of range are clamped to the first or last page.
+
+        Returns:
+            tuple[str, View]: The text of the page, and the view containing the page buttons.
+        """
+        current_queue = self.active_players.get(guild_id).queue
+        current_song = self.active_players.get(guild_id).current_song
 
         current_song_text = "__Current Song__\n"
         if current_song:
-            current_song_text += current_song.title
+            current_song_text += current_song.title or current_song.url
         else:
             current_song_text += COG_STRINGS["music_embed_title_idle"]
 
-        QUEUE_CUTOFF = 15
-        if len(current_queue) > 2 * QUEUE_CUTOFF + 5:
-            first_set = current_queue[:QUEUE_CUTOFF]
-            last_set = current_queue[-QUEUE_CUTOFF:]
-            remaining = len(current_queue) - 2 * QUEUE_CUTOFF
-            first_set_formatted = "\n".join(
-                [f"{idx+1}. {song.title}" for idx, song in enumerate(first_set)]
-            )
-            last_set_formatted = "\n".join(
-                [
-                    f"{idx+1+remaining+QUEUE_CUTOFF}. {song.title}"
-                    for idx, song in enumerate(last_set)
-                ]
-            )
-            separator = f"\n\n... and **`{remaining}`** more ... \n\n"
-            formatted_queue = f"{first_set_formatted}{separator}{last_set_formatted}"
+        page_count = max(1, -(-len(current_queue) // QUEUE_PAGE_SIZE))
+        page = min(max(page, 0), page_count - 1)
+
+        if not current_queue:
+            current_queue_text = f"__Up Next__\n{COG_STRINGS['music_empty_queue_text']}"
         else:
-            formatted_queue = "\n".join(
-                [f"{idx+1}. {song.title}" for idx, song in enumerate(current_queue)]
+            page_text = await self.get_queue_page(guild_id, page)
+            current_queue_text = (
+                f"__Up Next__ (page {page + 1}/{page_count})\n{page_text}"
             )
 
-        current_queue_text = f"__Up Next__\n{COG_STRINGS['music_empty_queue_text'] if not current_queue else formatted_queue}"
         queue_text = f"{current_song_text}\n\n{current_queue_text}"
+        return queue_text, create_queue_page_actionbar(page, page_count)
 
-        await respond_or_followup(
-            queue_text, interaction, ephemeral=True, delete_after=None
-        )
-        return True
+    async def get_queue_page(self, guild_id: int, page: int) -> str:
+        """Get the formatted text of a page of a guild's queue. Pages are cached until the queue changes,
+        so that browsing a large queue only fetches and formats the titles of each page once.
+
+        Args:
+            guild_id (int): The ID of the guild whose queue to format.
+            page (int): The index of the page.
+
+        Returns:
+            str: The numbered titles of the songs in the page.
+        """
+        current_queue = self.active_players.get(guild_id).queue
+        version, pages = self.queue_page_cache.get(guild_id, (None, {}))
+        if version != current_queue.version:
+            pages = {}
+            self.queue_page_cache[guild_id] = (current_queue.version, pages)
+
+        if page not in pages:
+            start = page * QUEUE_PAGE_SIZE
+            entries = current_queue.entries(start, start + QUEUE_PAGE_SIZE)
+            await fetch_track_metadata([x for x, _ in entries])
+            pages[page] = "\n".join(
+                [
+                    f"{start+idx+1}. {get_entry_title(video_id)}"
+                    for idx, (video_id, _) in enumerate(entries)
+                ]
+            )
+        return pages[page]
 
     def end_playback(self, guild_id: int):
         """If a guild is currently playing, stop playing. Also ensures that the guild is
@@ -1479,35 +3370,78 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
         Args:
             guild_id (int): The ID of the guild to stop playback in.
         """
+        self.active_players.get(guild_id).generation += 1
         if self.active_players.get(guild_id).voice_client.is_playing():
             self.active_players.get(guild_id).voice_client.stop()
 
-        self.active_players.get(guild_id).queue = []
+        self.active_players.get(guild_id).queue.clear()
         self.active_players.get(guild_id).current_song = None
+        self.discard_preload(guild_id)
+        self.playing.discard(guild_id)
+
+        self.mark_inactive(guild_id)
+
+    async def get_music_message(self, guild_id: int) -> Union[Message, None]:
+        """Get the message containing the music embed of a given guild. The message is cached
+        after it is first fetched, so that the DB and Discord are only queried once per guild.
 
-        self.inactive[guild_id] = datetime.now()
-        # TODO: Check self.playing list if present.
-        self.run_tasks()
+        Args:
+            guild_id (int): The ID of the guild to get the music message of.
+
+        Returns:
+            Union[Message, None]: The music message of the guild, or None if the guild has no music channel.
+        """
+        if guild_id in self.music_messages:
+            return self.music_messages.get(guild_id)
+
+        db_entry = DBSession.get(MusicChannels, guild_id=guild_id)
+        embed_message = None
+        if db_entry:
+            channel = self.bot.get_guild(guild_id).get_channel(db_entry.channel_id)
+            try:
+                embed_message = await channel.fetch_message(db_entry.message_id)
+            except (AttributeError, NotFound):
+                self.logger.warning(
+                    f"Unable to find the music message for guild with id {guild_id}"
+                )
+
+        self.music_messages[guild_id] = embed_message
+        return embed_message
 
     async def update_embed(self, guild_id: int) -> bool:
-        """Update the embed of a given guild. If there is a song playing, ensure that
-        it's data is displayed, otherwise ensure that the embed is reset to default.
-        Also ensures the the action row has the correct buttons.
+        """Schedule an update of the embed of a given guild. Updates requested within
+        EMBED_UPDATE_DELAY seconds of each other are combined into a single edit which
+        uses the state of the guild at the time of the edit.
 
         Args:
             guild_id (int): The ID of the guild to update.
 
         Returns:
-            bool: If the embed was able to be updated.
+            bool: If the guild has a music message to update.
         """
-        db_entry = DBSession.get(MusicChannels, guild_id=guild_id)
-        if not db_entry:
+        if await self.get_music_message(guild_id) is None:
             return False
-        embed_message = (
-            await self.bot.get_guild(guild_id)
-            .get_channel(db_entry.channel_id)
-            .fetch_message(db_entry.message_id)
-        )
+
+        if guild_id not in self.pending_embed_updates:
+            self.pending_embed_updates[guild_id] = self.bot.loop.create_task(
+                self.edit_embed(guild_id)
+            )
+        return True
+
+    async def edit_embed(self, guild_id: int):
+        """Edit the embed of a given guild after EMBED_UPDATE_DELAY seconds. If there is a song
+        playing, ensure that it's data is displayed, otherwise ensure that the embed is reset
+        to default. Also ensures the the action row has the correct buttons.
+
+        Args:
+            guild_id (int): The ID of the guild to update.
+        """
+        await asyncio.sleep(EMBED_UPDATE_DELAY)
+        self.pending_embed_updates.pop(guild_id, None)
+
+        embed_message = await self.get_music_message(guild_id)
+        if embed_message is None:
+            return
 
         current_embed: Embed = embed_message.embeds[0]
         if (
@@ -1519,7 +3453,7 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
                 value=self.active_players.get(guild_id).volume
             )
             user = COG_STRINGS["music_embed_request_user"].format(
-                user=current_song.request_member.mention
+                user=f"<@{current_song.request_member.id}>"
             )
             queue_length = COG_STRINGS["music_embed_queue_length"].format(
                 length=len(self.active_players.get(guild_id).queue)
@@ -1542,10 +3476,13 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             )
             is_paused = True
 
-        await embed_message.edit(
-            embed=new_embed, view=create_music_actionbar(is_paused)
-        )
-        return True
+        try:
+            self.music_messages[guild_id] = await embed_message.edit(
+                embed=new_embed, view=create_music_actionbar(is_paused)
+            )
+        except NotFound:
+            # The message was deleted, so it will need to be fetched again.
+            self.music_messages.pop(guild_id, None)
 
     async def stop_playback(self, interaction: Interaction) -> bool:
         """The interaction handler for when the custom ID of an interaction matches
@@ -1649,6 +3586,18 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
         """
         return await self.get_current_queue(interaction)
 
+    @command(
+        name=COG_STRINGS["music_edit_queue_name"],
+        description=COG_STRINGS["music_edit_queue_description"],
+    )
+    async def edit_queue(self, interaction: Interaction):
+        """The command to move or remove a song in the queue. Invokes the EDIT_QUEUE UserActionType interaction handler.
+
+        Args:
+            interaction (Interaction): The interaction of the command.
+        """
+        return await self.edit_queue_handler(interaction)
+
     @command(
         name=COG_STRINGS["music_stop_name"],
         description=COG_STRINGS["music_stop_description"],
@@ -1686,10 +3635,7 @@ class VCMusic(GroupCog, name=COG_STRINGS["music_group_name"]):
             )
             return False
 
-        self.active_players.get(interaction.guild.id).voice_client.source.volume = (
-            float(volume) / float(100)
-        )
-        self.active_players.get(interaction.guild.id).volume = volume
+        self.apply_volume(interaction.guild.id, volume)
         await self.update_embed(interaction.guild.id)
         await respond_or_followup(
             COG_STRINGS["music_volume_set_success"].format(value=volume), interaction
@@ -1,4 +1,8 @@
+import asyncio
 import logging
+import os
+from collections import deque
+from time import monotonic
 
 from discord import Interaction, Member, PermissionOverwrite, VoiceChannel, VoiceState
 from discord.app_commands import (
@@ -8,36 +12,221 @@ from discord.app_commands import (
     guild_only,
     rename,
 )
-from discord.errors import Forbidden
+from discord.errors import Forbidden, HTTPException, NotFound
 from discord.ext.commands import Bot, GroupCog
 
 from client import EsportsBot
-from common.discord import primary_key_from_object
+from common.discord import VoiceEvent, VoiceEventClassifier, primary_key_from_object
 from common.io import load_banned_words, load_cog_toml
-from common.util import r_replace
+from common.util import WordMatcher, r_replace
 from database.gateway import DBSession
-from database.models import VoiceAdminChild, VoiceAdminParent
+from database.models import VoiceAdminChild, VoiceAdminParent, VoiceAdminPooled
 
 COG_STRINGS = load_cog_toml(__name__)
-BANNED_WORDS = load_banned_words()
+BANNED_WORDS = WordMatcher(x.lower() for x in load_banned_words())
+# Characters that are commonly used in place of letters, and characters that are invisible or used to break up
+# words, which are removed
+LEET_TRANSLATION = str.maketrans(
+    {
+        "4": "a",
+        "@": "a",
+        "8": "b",
+        "ß": "b",
+        "3": "e",
+        "6": "g",
+        "1": "i",
+        "!": "i",
+        "2": "r",
+        "5": "s",
+        "7": "t",
+        "+": "t",
+        **dict.fromkeys("_-'|~\"", None),
+        **dict.fromkeys(
+            "\u00ad\u034f\u061c\u115f\u1160\u17b4\u17b5\u180e\u200b\u200c\u200d\u200e\u200f"
+            "\u202a\u202b\u202c\u202d\u202e\u2060\u2061\u2062\u2063\u2064\u3164\ufeff",
+            None,
+        ),
+        **dict.fromkeys(
+            "\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+            "\u2028\u2029\u202f\u205f\u3000",
+            " ",
+        ),
+    }
+)
+POOL_SIZE = int(os.getenv("VOICE_ADMIN_POOL_SIZE") or 0)
+# Discord allows each channel to be renamed twice every 10 minutes
+RENAME_LIMIT = 2
+RENAME_PERIOD = 600
+
+
+class VoiceAdminIndex:
+    """An in-memory copy of the IDs of every parent and child Voice Channel, along with the owner of each child
+    Voice Channel and the pooled Voice Channels of each parent. Loaded from the DB once, and then kept up to date
+    whenever the DB is written to, so that voice state updates can be checked without querying the DB.
+    """
+
+    def __init__(self):
+        self.parents: set[int] = set()
+        self.children: dict[int, int] = {}
+        self.pooled: dict[int, list[int]] = {}
+
+    def load(self):
+        self.parents = {x.channel_id for x in DBSession.list(VoiceAdminParent)}
+        self.children = {
+            x.channel_id: x.owner_id for x in DBSession.list(VoiceAdminChild)
+        }
+        self.pooled = {}
+        for item in DBSession.list(VoiceAdminPooled):
+            self.pooled.setdefault(item.parent_id, []).append(item.channel_id)
+
+    def add_parent(self, channel_id: int):
+        self.parents.add(channel_id)
+
+    def remove_parent(self, channel_id: int):
+        self.parents.discard(channel_id)
+
+    def set_child(self, channel_id: int, owner_id: int):
+        self.children[channel_id] = owner_id
+
+    def remove_child(self, channel_id: int):
+        self.children.pop(channel_id, None)
+
+    def add_pooled(self, parent_id: int, channel_id: int):
+        self.pooled.setdefault(parent_id, []).append(channel_id)
+
+    def take_pooled(self, parent_id: int) -> int | None:
+        pooled = self.pooled.get(parent_id)
+        return pooled.pop() if pooled else None
+
+    def remove_pooled(self, parent_id: int) -> list[int]:
+        return self.pooled.pop(parent_id, [])
+
+
+VOICE_ADMIN_INDEX = VoiceAdminIndex()
+
+
+class ChannelRenamer:
+    """Renames channels in the background without exceeding Discord's limit on channel renames. Only the latest
+    requested name of each channel is kept, so that renames requested while waiting for the limit are combined
+    into one.
+    """
+
+    def __init__(self, limit: int = RENAME_LIMIT, period: float = RENAME_PERIOD):
+        self.limit = limit
+        self.period = period
+        self.logger = logging.getLogger(__name__)
+        self.history: dict[int, deque[float]] = {}
+        self.pending: dict[int, str] = {}
+        self.tasks: dict[int, asyncio.Task] = {}
+
+    def name_of(self, channel: VoiceChannel) -> str:
+        """Get the name that a channel will have once its pending rename has been applied.
+
+        Args:
+            channel (VoiceChannel): The channel to get the name of.
+
+        Returns:
+            str: The pending name of the channel, or its current name if there is no pending rename.
+        """
+        return self.pending.get(channel.id, channel.name)
+
+    def rename(self, channel: VoiceChannel, name: str):
+        """Rename a channel as soon as the rate limit allows, replacing any pending rename of the channel.
+
+        Args:
+            channel (VoiceChannel): The channel to rename.
+            name (str): The new name of the channel.
+        """
+        if name == self.name_of(channel):
+            return
+        self.pending[channel.id] = name
+        task = self.tasks.get(channel.id)
+        if not task or task.done():
+            self.tasks[channel.id] = asyncio.create_task(self.apply(channel))
+
+    def record(self, channel_id: int):
+        """Record that a channel has been renamed outside of the renamer.
+
+        Args:
+            channel_id (int): The ID of the channel that was renamed.
+        """
+        self.history.setdefault(channel_id, deque(maxlen=self.limit)).append(
+            monotonic()
+        )
+
+    def claim(self, channel: VoiceChannel, name: str) -> bool:
+        """Claim a rename of a channel so that it can be sent along with another edit of the channel. A rename
+        can only be claimed if the rate limit allows it now and no other rename of the channel is in progress.
+
+        Args:
+            channel (VoiceChannel): The channel to rename.
+            name (str): The new name of the channel.
+
+        Returns:
+            bool: If the rename was claimed, in which case the caller must send the new name itself.
+        """
+        task = self.tasks.get(channel.id)
+        if name == channel.name or (task and not task.done()) or self.delay(channel.id):
+            return False
+        self.pending.pop(channel.id, None)
+        self.record(channel.id)
+        return True
+
+    def delay(self, channel_id: int) -> float:
+        history = self.history.get(channel_id)
+        if not history or len(history) < self.limit:
+            return 0
+        return max(0, history[0] + self.period - monotonic())
+
+    def forget(self, channel_id: int):
+        """Drop the pending rename and history of a channel, such as when it has been deleted.
+
+        Args:
+            channel_id (int): The ID of the channel to forget.
+        """
+        self.pending.pop(channel_id, None)
+        self.history.pop(channel_id, None)
+        task = self.tasks.pop(channel_id, None)
+        if task:
+            task.cancel()
+
+    async def apply(self, channel: VoiceChannel):
+        while channel.id in self.pending:
+            delay = self.delay(channel.id)
+            if delay:
+                await asyncio.sleep(delay)
+                continue
+
+            name = self.pending.pop(channel.id)
+            if name == channel.name:
+                continue
+            self.record(channel.id)
+            try:
+                await channel.edit(name=name)
+            except NotFound:
+                self.forget(channel.id)
+                return
+            except HTTPException as e:
+                self.logger.error(
+                    f"Unable to rename Voice Channel to {name} "
+                    f"(guildid - {channel.guild.id} | channelid - {channel.id}) - {e}"
+                )
+        self.tasks.pop(channel.id, None)
+
+
+CHANNEL_RENAMER = ChannelRenamer()
 
 
 def channel_is_child(channel: VoiceChannel):
     if not channel:
         return False
-    db_result = DBSession.get(
-        VoiceAdminChild, guild_id=channel.guild.id, channel_id=channel.id
-    )
-    return not not db_result
+    return channel.id in VOICE_ADMIN_INDEX.children
 
 
 def channel_is_parent(channel: VoiceChannel):
     if not channel:
         return False
-    db_result = DBSession.get(
-        VoiceAdminParent, guild_id=channel.guild.id, channel_id=channel.id
-    )
-    return not not db_result
+    return channel.id in VOICE_ADMIN_INDEX.parents
 
 
 def member_is_owner(
@@ -47,60 +236,92 @@ def member_is_owner(
         return False
 
     if db_entry is None:
-        db_entry: VoiceAdminChild = DBSession.get(
-            VoiceAdminChild, guild_id=channel.guild.id, channel_id=channel.id
-        )
-        if db_entry is None:
-            return False
+        return VOICE_ADMIN_INDEX.children.get(channel.id) == member.id
     return db_entry.owner_id == member.id
 
 
+def get_locked_overwrites(
+    voice_channel: VoiceChannel, manage_permissions: bool = True
+) -> dict:
+    """Get the permission overwrites of a child Voice Channel once it has been locked, so that they can be applied
+    in a single edit. Only the members currently in the Voice Channel, and the bot, are allowed to connect.
+
+    Args:
+        voice_channel (VoiceChannel): The child Voice Channel to lock.
+        manage_permissions (bool, optional): If the bot's top role should be allowed to manage the Voice Channel
+        and its permissions. Defaults to True.
+
+    Returns:
+        dict: The new permission overwrites, keyed by Role or Member.
+    """
+    overwrites = {}
+    for target, overwrite in voice_channel.overwrites.items():
+        overwrite = PermissionOverwrite.from_pair(*overwrite.pair())
+        overwrite.connect = False
+        overwrite.speak = False
+        overwrites[target] = overwrite
+
+    bot_overwrite = PermissionOverwrite(connect=True, view_channel=True)
+    if manage_permissions:
+        bot_overwrite.manage_channels = True
+        bot_overwrite.manage_permissions = True
+    overwrites[voice_channel.guild.me.top_role] = bot_overwrite
+    overwrites[voice_channel.guild.default_role] = PermissionOverwrite(
+        speak=False, connect=False
+    )
+    for member in voice_channel.members:
+        overwrites[member] = PermissionOverwrite(
+            connect=True, speak=True, view_channel=True
+        )
+    return overwrites
+
+
+def get_unlocked_overwrites(voice_channel: VoiceChannel) -> dict:
+    """Get the permission overwrites of a child Voice Channel once it has been unlocked, which are those of its
+    category, or its current ones if it has no category, without any overwrite for @everyone.
+
+    Args:
+        voice_channel (VoiceChannel): The child Voice Channel to unlock.
+
+    Returns:
+        dict: The new permission overwrites, keyed by Role or Member.
+    """
+    overwrites = dict(
+        voice_channel.category.overwrites
+        if voice_channel.category
+        else voice_channel.overwrites
+    )
+    overwrites.pop(voice_channel.guild.default_role, None)
+    return overwrites
+
+
 def check_vc_name_allowed(new_name: str) -> bool:
-    # TOOD: Remove hidden characters (zero width space, alternate white space characters)
-    trimmed_name = new_name.strip()
-    if trimmed_name in ("", " "):
+    leet_sub_name = simple_leet_substitution(new_name).strip()
+    if not leet_sub_name:
         return True
 
-    leet_sub_name = simple_leet_substitution(trimmed_name)
-    for word in BANNED_WORDS:
-        if word in leet_sub_name:
-            return check_word_position(leet_sub_name, word)
+    for position, word in BANNED_WORDS.find(leet_sub_name):
+        if not check_word_position(leet_sub_name, word, position):
+            return False
     return True
 
 
 def simple_leet_substitution(input_string: str) -> str:
-    leet_characters = {
-        "a": ["4", "@"],
-        "b": ["8", "ß", "l3"],
-        "e": ["3"],
-        "g": ["6"],
-        "i": ["1", "!"],
-        "r": ["2"],
-        "s": ["5"],
-        "t": ["7", "+"],
-        "": ["_", "-", "'", "|", "~", '"'],
-    }
+    return input_string.lower().replace("l3", "b").translate(LEET_TRANSLATION)
 
-    output_string = input_string
-    for replace_with, to_replace in leet_characters.items():
-        for character in to_replace:
-            output_string = output_string.replace(character, replace_with)
 
-    return output_string
-
-
-def check_word_position(input_word: str, matched_banned_word: str) -> bool:
+def check_word_position(
+    input_word: str, matched_banned_word: str, position: int
+) -> bool:
     if input_word == matched_banned_word:
         # The input word is the banned word
         return False
 
-    if input_word.index(matched_banned_word) == 0:
+    if position == 0:
         # The banned word is at the start of the input word
         return False
 
-    if input_word.index(matched_banned_word) == len(input_word) - len(
-        matched_banned_word
-    ):
+    if position == len(input_word) - len(matched_banned_word):
         # The banned word is at the end of the input word
         return False
 
@@ -124,8 +345,170 @@ class VoiceAdmin(GroupCog, name=COG_STRINGS["vc_admin_group_name"]):
         """
         self.bot = bot
         self.logger = logging.getLogger(__name__)
+        self.voice_events = VoiceEventClassifier()
+        self.pool_tasks: dict[int, asyncio.Task] = {}
+        VOICE_ADMIN_INDEX.load()
         self.logger.info(f"{__name__}.{__class__.__name__} has been added as a Cog")
 
+    async def cog_unload(self):
+        for task in self.pool_tasks.values():
+            task.cancel()
+        for channel_id in list(CHANNEL_RENAMER.tasks):
+            CHANNEL_RENAMER.forget(channel_id)
+        self.logger.info(
+            f"Skipped {self.voice_events.skipped} of {self.voice_events.counts.total()} voice state updates"
+        )
+
+    @GroupCog.listener()
+    async def on_ready(self):
+        # Pools left over from before a restart may no longer exist or match POOL_SIZE.
+        for parent_id in list(VOICE_ADMIN_INDEX.pooled):
+            task = self.pool_tasks.get(parent_id)
+            if task and not task.done():
+                continue
+            keep = POOL_SIZE if parent_id in VOICE_ADMIN_INDEX.parents else 0
+            await self.prune_pool(parent_id, keep)
+
+        if not POOL_SIZE:
+            return
+        for parent_id in VOICE_ADMIN_INDEX.parents:
+            parent = self.bot.get_channel(parent_id)
+            if parent:
+                self.refill_pool(parent)
+
+    def refill_pool(self, parent: VoiceChannel):
+        """Start filling the pool of a parent Voice Channel in the background, unless it is already being filled.
+
+        Args:
+            parent (VoiceChannel): The parent Voice Channel whose pool should be filled.
+        """
+        task = self.pool_tasks.get(parent.id)
+        if task and not task.done():
+            return
+        self.pool_tasks[parent.id] = asyncio.create_task(self.fill_pool(parent))
+
+    async def fill_pool(self, parent: VoiceChannel):
+        """Create hidden child Voice Channels for a parent Voice Channel until it has POOL_SIZE of them.
+
+        Args:
+            parent (VoiceChannel): The parent Voice Channel whose pool should be filled.
+        """
+        await self.prune_pool(parent.id, POOL_SIZE)
+        while (
+            channel_is_parent(parent)
+            and len(VOICE_ADMIN_INDEX.pooled.get(parent.id, [])) < POOL_SIZE
+        ):
+            overwrites = dict(parent.category.overwrites) if parent.category else {}
+            default_role = parent.guild.default_role
+            hidden = overwrites.get(default_role, PermissionOverwrite())
+            hidden = PermissionOverwrite.from_pair(*hidden.pair())
+            hidden.view_channel = False
+            overwrites[default_role] = hidden
+
+            try:
+                if parent.category:
+                    pooled_channel: VoiceChannel = (
+                        await parent.category.create_voice_channel(
+                            name=COG_STRINGS["pooled_vc_name"], overwrites=overwrites
+                        )
+                    )
+                else:
+                    pooled_channel: VoiceChannel = (
+                        await parent.guild.create_voice_channel(
+                            name=COG_STRINGS["pooled_vc_name"], overwrites=overwrites
+                        )
+                    )
+            except HTTPException as e:
+                self.logger.error(
+                    f"Unable to create pooled Voice Channel for {parent.name} "
+                    f"(guildid - {parent.guild.id} | channelid - {parent.id}) - {e}"
+                )
+                return
+
+            db_entry: VoiceAdminPooled = VoiceAdminPooled(
+                primary_key=primary_key_from_object(pooled_channel),
+                guild_id=pooled_channel.guild.id,
+                channel_id=pooled_channel.id,
+                parent_id=parent.id,
+            )
+            DBSession.create(db_entry)
+            VOICE_ADMIN_INDEX.add_pooled(parent.id, pooled_channel.id)
+
+    async def prune_pool(self, parent_id: int, keep: int):
+        """Forget the pooled Voice Channels of a parent Voice Channel that have been deleted, and delete any
+        pooled Voice Channels beyond the number to keep.
+
+        Args:
+            parent_id (int): The ID of the parent Voice Channel whose pool should be pruned.
+            keep (int): The most pooled Voice Channels to keep.
+        """
+        kept = []
+        removed = []
+        for channel_id in VOICE_ADMIN_INDEX.remove_pooled(parent_id):
+            pooled_channel = self.bot.get_channel(channel_id)
+            if pooled_channel and len(kept) < keep:
+                kept.append(channel_id)
+            else:
+                removed.append((channel_id, pooled_channel))
+        for channel_id in kept:
+            VOICE_ADMIN_INDEX.add_pooled(parent_id, channel_id)
+
+        for channel_id, pooled_channel in removed:
+            db_entry = DBSession.get(VoiceAdminPooled, channel_id=channel_id)
+            if db_entry:
+                DBSession.delete(db_entry)
+            if pooled_channel:
+                try:
+                    await pooled_channel.delete()
+                except HTTPException as e:
+                    self.logger.warning(
+                        f"Unable to delete pooled Voice Channel (channelid - {channel_id}) - {e}"
+                    )
+
+    def take_pooled_channel(self, parent: VoiceChannel) -> VoiceChannel | None:
+        """Remove a pooled Voice Channel from the pool of a parent Voice Channel.
+
+        Args:
+            parent (VoiceChannel): The parent Voice Channel to take a pooled Voice Channel from.
+
+        Returns:
+            VoiceChannel | None: The pooled Voice Channel, or None if the pool is empty.
+        """
+        while (channel_id := VOICE_ADMIN_INDEX.take_pooled(parent.id)) is not None:
+            db_entry = DBSession.get(
+                VoiceAdminPooled, guild_id=parent.guild.id, channel_id=channel_id
+            )
+            if db_entry:
+                DBSession.delete(db_entry)
+            pooled_channel = parent.guild.get_channel(channel_id)
+            if pooled_channel:
+                return pooled_channel
+        return None
+
+    async def delete_pool(self, parent: VoiceChannel):
+        """Delete every pooled Voice Channel of a parent Voice Channel.
+
+        Args:
+            parent (VoiceChannel): The parent Voice Channel whose pool should be deleted.
+        """
+        task = self.pool_tasks.pop(parent.id, None)
+        if task:
+            task.cancel()
+        for channel_id in VOICE_ADMIN_INDEX.remove_pooled(parent.id):
+            db_entry = DBSession.get(
+                VoiceAdminPooled, guild_id=parent.guild.id, channel_id=channel_id
+            )
+            if db_entry:
+                DBSession.delete(db_entry)
+            pooled_channel = parent.guild.get_channel(channel_id)
+            if pooled_channel:
+                try:
+                    await pooled_channel.delete()
+                except HTTPException as e:
+                    self.logger.warning(
+                        f"Unable to delete pooled Voice Channel (channelid - {channel_id}) - {e}"
+                    )
+
     @GroupCog.listener()
     async def on_voice_state_update(
         self, member: Member, before: VoiceState, after: VoiceState
@@ -141,19 +524,21 @@ class VoiceAdmin(GroupCog, name=COG_STRINGS["vc_admin_group_name"]):
             before (VoiceState): The Voice State prior to the update.
             after (VoiceState): The new Voice State after the update.
         """
+        if self.voice_events.classify(before, after) == VoiceEvent.NOOP:
+            return
+
+        if not channel_is_child(before.channel) and not channel_is_parent(
+            after.channel
+        ):
+            return
+
         if not member.guild.me.guild_permissions.move_members:
             self.logger.error(
                 f"Missing perimssion `move_members` in guild {member.guild.name} (guildid - {member.guild.id})!"
             )
             return
 
-        if not before.channel and not after.channel:
-            return
-
-        if before.channel:
-            if not channel_is_child(before.channel):
-                return
-
+        if channel_is_child(before.channel):
             if (
                 not before.channel.category
                 and not member.guild.me.guild_permissions.manage_channels
@@ -177,27 +562,35 @@ class VoiceAdmin(GroupCog, name=COG_STRINGS["vc_admin_group_name"]):
                 )
                 return
 
-            db_entry: VoiceAdminChild = DBSession.get(
-                VoiceAdminChild,
-                guild_id=before.channel.guild.id,
-                channel_id=before.channel.id,
-            )
-
             if not before.channel.members:
                 await before.channel.delete()
-                DBSession.delete(db_entry)
+                db_entry: VoiceAdminChild = DBSession.get(
+                    VoiceAdminChild,
+                    guild_id=before.channel.guild.id,
+                    channel_id=before.channel.id,
+                )
+                if db_entry:
+                    DBSession.delete(db_entry)
+                VOICE_ADMIN_INDEX.remove_child(before.channel.id)
+                CHANNEL_RENAMER.forget(before.channel.id)
                 if not channel_is_parent(after.channel):
                     return
 
-            if member_is_owner(member, before.channel, db_entry):
+            elif member_is_owner(member, before.channel):
                 new_owner = before.channel.members[0]
+                db_entry: VoiceAdminChild = DBSession.get(
+                    VoiceAdminChild,
+                    guild_id=before.channel.guild.id,
+                    channel_id=before.channel.id,
+                )
                 db_entry.owner_id = new_owner.id
                 DBSession.update(db_entry)
+                VOICE_ADMIN_INDEX.set_child(before.channel.id, new_owner.id)
                 self.logger.info(
                     f"Deleted child Voice Channel - "
                     f"{before.channel.name} (guildid - {before.channel.guild.id} | channelid - {before.channel.id}"
                 )
-                await before.channel.edit(name=f"{new_owner.display_name}'s VC")
+                CHANNEL_RENAMER.rename(before.channel, f"{new_owner.display_name}'s VC")
 
         if after.channel:
             if not channel_is_parent(after.channel):
@@ -226,18 +619,25 @@ class VoiceAdmin(GroupCog, name=COG_STRINGS["vc_admin_group_name"]):
                 )
                 return
 
-            if after.channel.category:
-                new_child_channel: VoiceChannel = (
-                    await after.channel.category.create_voice_channel(
-                        name=f"{member.display_name}'s VC"
+            new_child_channel = None
+            if POOL_SIZE:
+                new_child_channel = self.take_pooled_channel(after.channel)
+                self.refill_pool(after.channel)
+            is_pooled = new_child_channel is not None
+
+            if not is_pooled:
+                if after.channel.category:
+                    new_child_channel: VoiceChannel = (
+                        await after.channel.category.create_voice_channel(
+                            name=f"{member.display_name}'s VC"
+                        )
                     )
-                )
-            else:
-                new_child_channel: VoiceChannel = (
-                    await after.channel.guild.create_voice_channel(
-                        name=f"{member.display_name}'s VC"
+                else:
+                    new_child_channel: VoiceChannel = (
+                        await after.channel.guild.create_voice_channel(
+                            name=f"{member.display_name}'s VC"
+                        )
                     )
-                )
             db_entry: VoiceAdminChild = VoiceAdminChild(
                 primary_key=primary_key_from_object(new_child_channel),
                 guild_id=new_child_channel.guild.id,
@@ -248,12 +648,25 @@ class VoiceAdmin(GroupCog, name=COG_STRINGS["vc_admin_group_name"]):
                 has_custom_name=False,
             )
             DBSession.create(db_entry)
+            VOICE_ADMIN_INDEX.set_child(new_child_channel.id, member.id)
             self.logger.info(
                 f"Created new child Voice Channel - "
                 f"{new_child_channel.name} (guildid - {new_child_channel.guild.id} | channelid - {new_child_channel.id})"
             )
             await member.move_to(new_child_channel)
 
+            if is_pooled:
+                # Reveal the pooled Voice Channel now that the member is in it
+                if new_child_channel.category:
+                    await new_child_channel.edit(
+                        name=f"{member.display_name}'s VC", sync_permissions=True
+                    )
+                else:
+                    await new_child_channel.edit(
+                        name=f"{member.display_name}'s VC", overwrites={}
+                    )
+                CHANNEL_RENAMER.record(new_child_channel.id)
+
     @command(
         name=COG_STRINGS["vc_set_parent_name"],
         description=COG_STRINGS["vc_set_parent_description"],
@@ -289,6 +702,9 @@ class VoiceAdmin(GroupCog, name=COG_STRINGS["vc_admin_group_name"]):
             channel_id=channel.id,
         )
         DBSession.create(db_entry)
+        VOICE_ADMIN_INDEX.add_parent(channel.id)
+        if POOL_SIZE:
+            self.refill_pool(channel)
         self.logger.info(
             f"Successfully added {channel.name} (guildid - {channel.guild.id} | channelid - {channel.id}) "
             f"to Parent Voice Channel DB Table!"
@@ -327,6 +743,8 @@ class VoiceAdmin(GroupCog, name=COG_STRINGS["vc_admin_group_name"]):
             VoiceAdminParent, guild_id=channel.guild.id, channel_id=channel.id
         )
         DBSession.delete(db_entry)
+        VOICE_ADMIN_INDEX.remove_parent(channel.id)
+        await self.delete_pool(channel)
         await interaction.followup.send(
             COG_STRINGS["vc_remove_parent_success"].format(channel=channel.name),
             ephemeral=True,
@@ -435,11 +853,11 @@ class VoiceAdminUser(GroupCog, name=COG_STRINGS["vc_group_name"]):
 
         if not new_name:
             if db_entry.has_custom_name:
-                await voice_channel.edit(name=name_set)
+                CHANNEL_RENAMER.rename(voice_channel, name_set)
                 db_entry.has_custom_name = False
                 DBSession.update(db_entry)
         else:
-            await voice_channel.edit(name=name_set)
+            CHANNEL_RENAMER.rename(voice_channel, name_set)
             if not db_entry.has_custom_name:
                 db_entry.has_custom_name = True
                 DBSession.update(db_entry)
@@ -490,64 +908,45 @@ class VoiceAdminUser(GroupCog, name=COG_STRINGS["vc_group_name"]):
             )
             return False
 
-        current_perms = voice_channel.overwrites
+        locked_name = f"{CHANNEL_RENAMER.name_of(voice_channel)}{COG_STRINGS['vc_locked_icon_with_delimiter']}"
+        # Send the lock icon with the overwrites when the rename limit allows, instead of as a separate rename
+        rename = {}
+        if not db_entry.is_locked and CHANNEL_RENAMER.claim(voice_channel, locked_name):
+            rename["name"] = locked_name
 
+        # Only mark the Voice Channel as locked once its permissions have been changed
         try:
-            await voice_channel.set_permissions(
-                voice_channel.guild.me.top_role,
-                connect=True,
-                view_channel=True,
-                manage_channels=True,
-                manage_permissions=True,
-            )
-        except Forbidden:
-            self.logger.error(
-                f"Unable to change permissions for {voice_channel.guild.me.top_role.name} Role for child Voice channel "
-                f"(guildid - {voice_channel.guild.id} | channelid - {voice_channel.id}, "
-                f"as it is the bot's top role and it is not an admin in {voice_channel.guild.name} guild"
-            )
-
-        for group, permission in current_perms.items():
-            permission.connect = False
-            permission.speak = False
             try:
-                await voice_channel.set_permissions(group, overwrite=permission)
+                await voice_channel.edit(
+                    overwrites=get_locked_overwrites(voice_channel), **rename
+                )
             except Forbidden:
                 self.logger.error(
                     f"Unable to change permissions for {voice_channel.guild.me.top_role.name} Role for child Voice channel "
-                    f"(guildid - {voice_channel.guild.id} | channelid - {voice_channel.id}"
+                    f"(guildid - {voice_channel.guild.id} | channelid - {voice_channel.id}, "
+                    f"as it is the bot's top role and it is not an admin in {voice_channel.guild.name} guild"
                 )
-
-        try:
-            await voice_channel.set_permissions(
-                voice_channel.guild.default_role,
-                overwrite=PermissionOverwrite(speak=False, connect=False),
-            )
-        except Forbidden:
+                await voice_channel.edit(
+                    overwrites=get_locked_overwrites(
+                        voice_channel, manage_permissions=False
+                    ),
+                    **rename,
+                )
+        except HTTPException as e:
             self.logger.error(
-                f"Unable to change permissions for {voice_channel.guild.me.top_role.name} Role for child Voice channel "
-                f"(guildid - {voice_channel.guild.id} | channelid - {voice_channel.id}"
+                f"Unable to lock child Voice channel "
+                f"(guildid - {voice_channel.guild.id} | channelid - {voice_channel.id}) - {e}"
             )
-
-        members = voice_channel.members
-        for member in members:
-            try:
-                await voice_channel.set_permissions(
-                    member, connect=True, speak=True, view_channel=True
-                )
-            except Forbidden:
-                self.logger.error(
-                    f"Unable to change permissions for {member.display_name} member for child Voice channel "
-                    f"(guildid - {voice_channel.guild.id} | channelid - {voice_channel.id}"
-                )
+            await interaction.followup.send(
+                COG_STRINGS["vc_lock_warn_failed"], ephemeral=True
+            )
+            return False
 
         if not db_entry.is_locked:
             db_entry.is_locked = True
             DBSession.update(db_entry)
-
-        await voice_channel.edit(
-            name=f"{voice_channel.name}{COG_STRINGS['vc_locked_icon_with_delimiter']}"
-        )
+            if not rename:
+                CHANNEL_RENAMER.rename(voice_channel, locked_name)
 
         await interaction.followup.send(COG_STRINGS["vc_lock_success"], ephemeral=True)
 
@@ -590,9 +989,8 @@ class VoiceAdminUser(GroupCog, name=COG_STRINGS["vc_group_name"]):
 
         if not db_entry.is_locked:
             if not voice_channel.permissions_synced:
-                await voice_channel.edit(sync_permissions=True)
-                await voice_channel.set_permissions(
-                    voice_channel.guild.default_role, overwrite=None
+                await voice_channel.edit(
+                    overwrites=get_unlocked_overwrites(voice_channel)
                 )
             await interaction.followup.send(
                 COG_STRINGS["vc_unlock_warn_not_locked"], ephemeral=True
@@ -601,15 +999,18 @@ class VoiceAdminUser(GroupCog, name=COG_STRINGS["vc_group_name"]):
 
         db_entry.is_locked = False
         DBSession.update(db_entry)
-        await voice_channel.edit(
-            name=r_replace(
-                voice_channel.name, COG_STRINGS["vc_locked_icon_with_delimiter"], ""
-            ),
-            sync_permissions=True,
-        )
-        await voice_channel.set_permissions(
-            voice_channel.guild.default_role, overwrite=None
+        unlocked_name = r_replace(
+            CHANNEL_RENAMER.name_of(voice_channel),
+            COG_STRINGS["vc_locked_icon_with_delimiter"],
+            "",
         )
+        if CHANNEL_RENAMER.claim(voice_channel, unlocked_name):
+            await voice_channel.edit(
+                overwrites=get_unlocked_overwrites(voice_channel), name=unlocked_name
+            )
+        else:
+            await voice_channel.edit(overwrites=get_unlocked_overwrites(voice_channel))
+            CHANNEL_RENAMER.rename(voice_channel, unlocked_name)
 
         await interaction.followup.send(
             COG_STRINGS["vc_unlock_success"], ephemeral=True
@@ -668,10 +1069,10 @@ class VoiceAdminUser(GroupCog, name=COG_STRINGS["vc_group_name"]):
         if not db_entry.is_limited:
             db_entry.is_limited = True
             DBSession.update(db_entry)
-
-        await voice_channel.edit(
-            name=f"{voice_channel.name}{COG_STRINGS['vc_limited_icon_with_delimiter']}"
-        )
+            CHANNEL_RENAMER.rename(
+                voice_channel,
+                f"{CHANNEL_RENAMER.name_of(voice_channel)}{COG_STRINGS['vc_limited_icon_with_delimiter']}",
+            )
 
         await interaction.followup.send(
             COG_STRINGS["vc_limit_success"].format(count=user_limit), ephemeral=True
@@ -721,11 +1122,14 @@ class VoiceAdminUser(GroupCog, name=COG_STRINGS["vc_group_name"]):
 
         db_entry.is_limited = False
         DBSession.update(db_entry)
-        await voice_channel.edit(
-            name=r_replace(
-                voice_channel.name, COG_STRINGS["vc_limited_icon_with_delimiter"], ""
+        await voice_channel.edit(user_limit=None)
+        CHANNEL_RENAMER.rename(
+            voice_channel,
+            r_replace(
+                CHANNEL_RENAMER.name_of(voice_channel),
+                COG_STRINGS["vc_limited_icon_with_delimiter"],
+                "",
             ),
-            user_limit=None,
         )
 
         await interaction.followup.send(